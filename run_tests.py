@@ -7,35 +7,102 @@ and generate test reports.
 """
 
 import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(cmd: list, description: str) -> bool:
-    """Run a command and return success status."""
+def run_command(
+    cmd: list,
+    description: str,
+    in_subprocess: bool = False,
+    env: dict | None = None,
+) -> bool:
+    """Run a pytest command and return success status.
+
+    pytest runs inside this interpreter unless in_subprocess is True, saving a
+    second interpreter startup and a second import of pytest.
+
+    env holds extra environment variables. They are exported from this process
+    so that a pytest subprocess and any xdist workers inherit them.
+    """
     print(f"\n{'=' * 60}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
     print("=" * 60)
 
+    if env:
+        os.environ.update(env)
+
+    if not in_subprocess:
+        if env and env.get("PYTHONDONTWRITEBYTECODE"):
+            sys.dont_write_bytecode = True  # The env var is only read at startup
+
+        # Imported here so that --help and argument errors don't pay for it
+        import pytest
+
+        return pytest.main(cmd[3:]) == 0
+
     result = subprocess.run(cmd, capture_output=False)
     return result.returncode == 0
 
 
 def main():
     """Main test runner function."""
-    parser = argparse.ArgumentParser(description="Run orbnet tests")
+    parser = argparse.ArgumentParser(
+        description="Run orbnet tests",
+        epilog=(
+            "To split the suite across K CI runners, use a matrix over i=0..K-1 and "
+            "run e.g. `python run_tests.py --num-shards K --shard-id i` on each. "
+            "Each shard still runs its tests in parallel across local CPUs."
+        ),
+    )
     parser.add_argument("--unit", action="store_true", help="Run unit tests only")
     parser.add_argument(
         "--integration", action="store_true", help="Run integration tests only"
     )
     parser.add_argument("--all", action="store_true", help="Run all tests (default)")
     parser.add_argument(
-        "--coverage", action="store_true", help="Run tests with coverage reporting"
+        "--coverage",
+        action="store_true",
+        help="Run tests with a terminal coverage report",
+    )
+    parser.add_argument(
+        "--coverage-full",
+        action="store_true",
+        help="Also write HTML and XML coverage reports (implies --coverage)",
+    )
+    parser.add_argument(
+        "--cov-context",
+        action="store_true",
+        help="Record which test covered each line (slower; implies --coverage)",
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument("--fast", action="store_true", help="Skip slow tests")
+    parser.add_argument(
+        "--fast", action="store_true", help="Skip slow tests (implies --no-cache)"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Only collect and list tests (quick check that discovery works)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the pytest cache (.pytest_cache) for this run",
+    )
+    rerun = parser.add_mutually_exclusive_group()
+    rerun.add_argument(
+        "--lf",
+        action="store_true",
+        help="Re-run only the tests that failed last time (needs the pytest cache)",
+    )
+    rerun.add_argument(
+        "--ff",
+        action="store_true",
+        help="Run last-failed tests first, then the rest (needs the pytest cache)",
+    )
     parser.add_argument(
         "--format",
         choices=["short", "long", "json"],
@@ -43,11 +110,39 @@ def main():
         help="Test output format",
     )
     parser.add_argument(
-        "--parallel", "-n", type=int, help="Run tests in parallel with N workers"
+        "--parallel",
+        "-n",
+        type=int,
+        help="Run tests in parallel with N workers (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--no-parallel", action="store_true", help="Run tests in a single process"
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run pytest in a separate interpreter instead of in-process",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help=(
+            "Fix PYTHONHASHSEED=0 so hash-based ordering is the same every run "
+            "(runs pytest in a new interpreter)"
+        ),
+    )
+    parser.add_argument(
+        "--num-shards", type=int, help="Split the suite into K shards (for CI)"
+    )
+    parser.add_argument(
+        "--shard-id", type=int, help="Index of the shard to run (0 to K-1)"
     )
 
     args = parser.parse_args()
 
+    if (args.num_shards is None) != (args.shard_id is None):
+        parser.error("--num-shards and --shard-id must be used together")
+
     # Default to running all tests if no specific type is specified
     if not any([args.unit, args.integration, args.all]):
         args.all = True
@@ -69,27 +164,74 @@ def main():
 
     if args.fast:
         cmd.extend(["-m", "not slow"])
+        args.no_cache = True
+
+    if args.list:
+        # Discovery-only runs gain nothing from the cache, coverage or workers
+        cmd.extend(["--collect-only", "-q", "--no-cov"])
+        if not (args.lf or args.ff):
+            args.no_cache = True
+        args.no_parallel = True
+
+    if (args.lf or args.ff) and args.no_cache:
+        print(
+            "Warning: --lf/--ff read the pytest cache; ignoring --no-cache",
+            file=sys.stderr,
+        )
+        args.no_cache = False
+
+    if args.lf:
+        cmd.append("--last-failed")
+    elif args.ff:
+        cmd.append("--failed-first")
+
+    if args.no_cache:
+        cmd.extend(["-p", "no:cacheprovider"])
 
     if args.format == "long":
         cmd.append("--tb=long")
     elif args.format == "json":
         cmd.extend(["--tb=no", "--json-report", "--json-report-file=test-report.json"])
 
-    if args.parallel:
-        cmd.extend(["-n", str(args.parallel)])
+    # Integration tests may not be process-safe, so only fan them out on request.
+    # loadfile keeps each module (and its fixtures) on a single worker.
+    if not args.no_parallel and (args.parallel or args.unit or args.all):
+        workers = args.parallel or "auto"
+        cmd.extend(["-n", str(workers), "--dist=loadfile"])
 
-    if args.coverage:
+    if args.num_shards is not None:
+        # A single shard cannot meet the suite-wide coverage threshold on its own
         cmd.extend(
             [
-                "--cov=src/orbnet",
-                "--cov-report=html",
-                "--cov-report=term-missing",
-                "--cov-report=xml",
+                f"--num-shards={args.num_shards}",
+                f"--shard-id={args.shard_id}",
+                "--cov-fail-under=0",
             ]
         )
 
-    # Add common options
-    cmd.extend(["--strict-markers", "--disable-warnings", "--color=yes"])
+    if args.coverage or args.coverage_full or args.cov_context:
+        # HTML and XML reports write a file per module, so only produce them
+        # when asked (e.g., in CI)
+        cmd.extend(["--cov=src/orbnet", "--cov-report=term-missing"])
+        if args.coverage_full:
+            cmd.extend(["--cov-report=html", "--cov-report=xml"])
+        if args.cov_context:
+            cmd.append("--cov-context=test")
+
+    # Add common options (pyproject's addopts already disables warnings); color
+    # only helps human readers
+    cmd.append("--strict-markers")
+    if args.format != "json":
+        cmd.append("--color=yes")
+
+    # Test runs are throwaway, so skip writing .pyc files in every worker
+    env = {"PYTHONDONTWRITEBYTECODE": "1"}
+    # The hash seed is fixed when an interpreter starts, so this process can't
+    # apply it to itself; pytest has to run in a fresh one
+    in_subprocess = args.subprocess
+    if args.deterministic:
+        env["PYTHONHASHSEED"] = "0"
+        in_subprocess = in_subprocess or os.environ.get("PYTHONHASHSEED") != "0"
 
     print("Orbnet Test Runner")
     print("==================")
@@ -97,11 +239,22 @@ def main():
     print(f"Working directory: {Path.cwd()}")
 
     # Run the tests
-    success = run_command(cmd, "Running tests")
+    success = run_command(
+        cmd,
+        "Collecting tests" if args.list else "Running tests",
+        in_subprocess=in_subprocess,
+        env=env,
+    )
 
-    if args.coverage and success:
+    if args.coverage_full and success:
         print("\nCoverage report generated in htmlcov/index.html")
 
+    if args.list:
+        print(
+            "\n✅ Test collection succeeded!" if success else "\n❌ Collection failed!"
+        )
+        return 0 if success else 1
+
     if success:
         print("\n✅ All tests passed!")
         return 0
@@ -1,17 +1,30 @@
-from importlib.metadata import version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__version__ = version("orbnet")
+if TYPE_CHECKING:
+    __version__: str
 
+    from .client import OrbAPIClient
+    from .models import (
+        AllDatasetsResponse,
+        ResponsivenessRecord,
+        ScoreRecord,
+        SpeedRecord,
+        WebResponsivenessRecord,
+        WifiLinkRecord,
+    )
 
-from .client import OrbAPIClient
-from .models import (
-    AllDatasetsResponse,
-    ResponsivenessRecord,
-    ScoreRecord,
-    SpeedRecord,
-    WebResponsivenessRecord,
-    WifiLinkRecord,
-)
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access rather than when the package is imported.
+_LAZY_IMPORTS = {
+    "OrbAPIClient": "client",
+    "ScoreRecord": "models",
+    "ResponsivenessRecord": "models",
+    "WebResponsivenessRecord": "models",
+    "SpeedRecord": "models",
+    "WifiLinkRecord": "models",
+    "AllDatasetsResponse": "models",
+}
 
 __all__ = [
     "OrbAPIClient",
@@ -22,3 +35,23 @@ __all__ = [
     "WifiLinkRecord",
     "AllDatasetsResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # Reading distribution metadata scans sys.path, so only do it on demand
+        from importlib.metadata import version
+
+        value = version("orbnet")
+    elif name in _LAZY_IMPORTS:
+        module = import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -1,19 +1,37 @@
 import asyncio
+import contextvars
+import functools
+import inspect
 import logging
-import uuid
+import random
+import secrets
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from importlib.metadata import version as get_version
-from typing import Any, Callable, Dict, List, Literal, Optional, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+    cast,
+)
 
 import httpx
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import from_json
 
 from .models import (
-    AllDatasetsRequestParams,
     AllDatasetsResponse,
-    DatasetRequestParams,
     OrbClientConfig,
     PollingConfig,
     ResponsivenessRecord,
-    ResponsivenessRequestParams,
     ScoreRecord,
     SpeedRecord,
     WebResponsivenessRecord,
@@ -22,6 +40,170 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Validators for each record type's response body. Creating a TypeAdapter is
+# expensive, so do it once here; validate_json then parses the raw bytes
+# straight into records without an intermediate list of dicts. Like the record
+# models, each validator is built on first use.
+_DEFERRED = ConfigDict(defer_build=True)
+_RECORD_LISTS: Dict[type[BaseModel], TypeAdapter[Any]] = {
+    model: TypeAdapter(List[model], config=_DEFERRED)
+    for model in (
+        ScoreRecord,
+        ResponsivenessRecord,
+        WebResponsivenessRecord,
+        SpeedRecord,
+        WifiLinkRecord,
+    )
+}
+
+RecordT = TypeVar("RecordT", bound=BaseModel)
+
+_GRANULARITIES = frozenset(("1s", "15s", "1m"))
+
+
+def _check_granularity(granularity: str) -> None:
+    """Reject granularities the Local API does not provide"""
+    if granularity not in _GRANULARITIES:
+        raise ValueError(
+            f"Invalid granularity: {granularity!r}. Valid options: 1s, 15s, 1m"
+        )
+
+
+def _parse_records(
+    raw_data: bytes, model: type[RecordT], validate: bool
+) -> List[RecordT]:
+    """Parse a dataset response body into records"""
+    if validate:
+        return _RECORD_LISTS[model].validate_json(raw_data)
+    return [model.model_construct(**record) for record in from_json(raw_data)]
+
+
+async def _settle(
+    key: str,
+    fetch: Callable[[], Awaitable[List[Any]]],
+    limit: Optional[asyncio.Semaphore] = None,
+) -> tuple[str, List[Any] | Dict[str, str]]:
+    """Run a dataset fetch, turning a failure into an error dict"""
+    try:
+        if limit is None:
+            return key, await fetch()
+        async with limit:
+            return key, await fetch()
+    except Exception as e:
+        return key, {"error": str(e)}
+
+
+async def _settle_as_completed(
+    fetches: Dict[str, Callable[[], Awaitable[List[Any]]]],
+    max_concurrency: Optional[int],
+) -> AsyncIterator[tuple[str, List[Any] | Dict[str, str]]]:
+    """Run fetches concurrently and yield their settled results as they finish"""
+    # as_completed has no concurrency limit of its own, so every task is
+    # started and the semaphore decides how many are requesting at once
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    pending = [
+        asyncio.create_task(_settle(key, fetch, limit))
+        for key, fetch in fetches.items()
+    ]
+    try:
+        for next_done in asyncio.as_completed(pending):
+            yield await next_done
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _run_in_thread(func: Callable, *args: Any) -> Any:
+    """Like asyncio.to_thread, but skips ctx.run when no context vars are set"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    if not ctx:
+        return await loop.run_in_executor(None, func, *args)
+    return await loop.run_in_executor(None, ctx.run, func, *args)
+
+
+# Datasets that poll_dataset accepts, mapped to the getter and positional
+# arguments that fetch them
+_POLLABLE_DATASETS: Dict[str, tuple[str, tuple[str, ...]]] = {
+    "scores_1m": ("get_scores_1m", ()),
+    "responsiveness_1s": ("get_responsiveness", ("1s",)),
+    "responsiveness_15s": ("get_responsiveness", ("15s",)),
+    "responsiveness_1m": ("get_responsiveness", ("1m",)),
+    "web_responsiveness_results": ("get_web_responsiveness", ()),
+    "speed_results": ("get_speed_results", ()),
+    "wifi_link_1s": ("get_wifi_link", ("1s",)),
+    "wifi_link_15s": ("get_wifi_link", ("15s",)),
+    "wifi_link_1m": ("get_wifi_link", ("1m",)),
+}
+
+# Record model for each known dataset
+_DATASET_MODELS: Dict[str, type[BaseModel]] = {
+    "scores_1m": ScoreRecord,
+    "responsiveness_1s": ResponsivenessRecord,
+    "responsiveness_15s": ResponsivenessRecord,
+    "responsiveness_1m": ResponsivenessRecord,
+    "web_responsiveness_results": WebResponsivenessRecord,
+    "speed_results": SpeedRecord,
+    "wifi_link_1s": WifiLinkRecord,
+    "wifi_link_15s": WifiLinkRecord,
+    "wifi_link_1m": WifiLinkRecord,
+}
+
+# Request paths for the known datasets, relative to the client's base_url
+_DATASET_PREFIX = "/api/v2/datasets/"
+_DATASET_PATHS = {name: f"{_DATASET_PREFIX}{name}.json" for name in _POLLABLE_DATASETS}
+
+# Connection pool for each client. get_all_datasets fetches up to nine
+# datasets at once, and keeping connections alive between polls avoids a new
+# TCP handshake on every request.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+
+
+# Upper bound on the time to wait for a connection, in seconds
+_CONNECT_TIMEOUT = 10.0
+
+# Responses that mean "try again later". Other errors are returned to the
+# caller straight away.
+_RETRY_STATUSES = frozenset((429, 502, 503, 504))
+# Failures where the request never reached the sensor, so retrying cannot
+# advance the caller_id's position twice
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retrying, preferring the server's Retry-After"""
+    retry_after = response.headers.get("Retry-After") if response else None
+    if retry_after:
+        delay: Optional[float]
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                delay = None
+            else:
+                if when.tzinfo is None:
+                    # A "-0000" zone parses as naive but still means UTC
+                    when = when.replace(tzinfo=timezone.utc)
+                delay = (when - datetime.now(timezone.utc)).total_seconds()
+        if delay is not None:
+            # Don't let a server stall a request indefinitely
+            return min(_RETRY_MAX_DELAY, max(0.0, delay))
+
+    backoff = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+    return backoff + random.uniform(0, _RETRY_BASE_DELAY)
+
+
+@functools.cache
+def _default_client_id() -> str:
+    """Default User-Agent, computed once since it reads package metadata"""
+    return f"orbnet/{get_version('orbnet')}"
+
 
 class OrbAPIClient:
     """
@@ -49,8 +231,24 @@ class OrbAPIClient:
         ... )
         >>> datasets = await client.get_all_datasets()
 
+        Reuse connections and close them when done:
+
+        >>> async with OrbAPIClient(host="192.168.1.100") as client:
+        ...     scores = await client.get_scores_1m()
+
+        The pool belongs to the event loop that created it. A client used from
+        a new loop (e.g., a second asyncio.run()) opens a new pool there.
     """
 
+    __slots__ = (
+        "config",
+        "_client",
+        "_client_loop",
+        "_sync_client",
+        "_default_params",
+        "_next_allowed_at",
+    )
+
     def __init__(
         self,
         host: str,
@@ -58,6 +256,7 @@ class OrbAPIClient:
         caller_id: Optional[str] = None,
         client_id: Optional[str] = None,
         timeout: float = 30.0,
+        max_retries: int = 3,
     ):
         """
         Initialize the Orb API client.
@@ -66,12 +265,17 @@ class OrbAPIClient:
             host: Hostname or IP address of the Orb sensor
             port: Port number for the Orb API (default: 7080)
             caller_id: Unique ID for this caller to track polling state.
-                      If None, generates a random UUID. Use the same caller_id
+                      If None, generates a random ID. Use the same caller_id
                       across requests to only receive new records.
             client_id: Optional identifier for the HTTP client itself (sent as
                       User-Agent). Useful for identifying different applications
                       or services. If None, uses a default identifier.
             timeout: Request timeout in seconds (default: 30.0)
+            max_retries: Number of times to retry a request that is rate
+                        limited (429), finds the sensor unavailable (502, 503,
+                        504), or cannot connect (default: 3). Retries honor
+                        the Retry-After header, otherwise back off
+                        exponentially. Use 0 to disable retries.
 
         Examples:
             Connect to Orb sensor:
@@ -96,10 +300,83 @@ class OrbAPIClient:
         self.config = OrbClientConfig(
             host=host,
             port=port,
-            caller_id=caller_id or str(uuid.uuid4()),
-            client_id=client_id or f"orbnet/{get_version('orbnet')}",
+            caller_id=caller_id or secrets.token_hex(12),
+            client_id=client_id or _default_client_id(),
             timeout=timeout,
+            max_retries=max_retries,
         )
+        # Created on first request, so clients that are never used (e.g., only
+        # to read their configuration) don't build a connection pool
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_client: Optional[httpx.Client] = None
+        # Query string for the common case of no per-request overrides, built
+        # as QueryParams once so httpx doesn't re-coerce it on every request
+        self._default_params = httpx.QueryParams(id=self.caller_id)
+        # Event loop time before which no request is sent, pushed back when the
+        # sensor asks us to slow down so concurrent fetches wait too
+        self._next_allowed_at = 0.0
+
+    async def __aenter__(self) -> "OrbAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __enter__(self) -> "OrbAPIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP connection pools.
+
+        Call this from the event loop the requests were made in; a pool left
+        over from an earlier, closed loop is discarded instead.
+        """
+        if self._client is not None:
+            # A pool left over from a closed loop can't be closed from this one
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = self._client_loop = None
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool used by the synchronous methods"""
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # The pool's connections belong to the loop that opened them (e.g.,
+            # an earlier asyncio.run() that has since closed), so start afresh
+            self._client = None
+            self._next_allowed_at = 0.0
+        if self._client is None:
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=self._get_timeout(),
+                limits=_POOL_LIMITS,
+            )
+        return self._client
+
+    def _get_sync_client(self) -> httpx.Client:
+        """Get the pooled synchronous HTTP client, creating it on first use"""
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(
+                base_url=self.base_url,
+                headers=self._get_headers(),
+                timeout=self._get_timeout(),
+                limits=_POOL_LIMITS,
+            )
+        return self._sync_client
 
     @property
     def host(self) -> str:
@@ -133,6 +410,13 @@ class OrbAPIClient:
         """Construct the base URL from host and port"""
         return f"http://{self.config.host}:{self.config.port}"
 
+    def _get_timeout(self) -> httpx.Timeout:
+        """Get the timeouts for the pooled HTTP clients"""
+        # A sensor that's reachable on the local network accepts connections
+        # quickly, so fail fast (and retry) rather than wait the full timeout
+        timeout = self.config.timeout
+        return httpx.Timeout(timeout, connect=min(_CONNECT_TIMEOUT, timeout))
+
     def _get_headers(self) -> Dict[str, str]:
         """Get common headers for API requests"""
         return {"Accept": "application/json", "User-Agent": self.client_id}
@@ -142,7 +426,7 @@ class OrbAPIClient:
         dataset_name: str,
         caller_id: Optional[str] = None,
         **params,
-    ) -> List[Dict[str, Any]]:
+    ) -> bytes:
         """
         Internal method to fetch a dataset from the Local Data API.
 
@@ -152,24 +436,174 @@ class OrbAPIClient:
             **params: Additional query parameters
 
         Returns:
-            List of records as dictionaries
+            Raw JSON response body (a list of records)
         """
-        caller = caller_id or self.config.caller_id
-        endpoint = f"{self.base_url}/api/v2/datasets/{dataset_name}.json"
+        endpoint, query_params = self._request_target(dataset_name, caller_id, params)
+        response = await self._request_with_retry(endpoint, query_params)
 
-        query_params = {"id": caller, **params}
+        return response.content
 
-        async with httpx.AsyncClient(timeout=self.config.timeout) as client:
-            response = await client.get(
-                endpoint, headers=self._get_headers(), params=query_params
-            )
+    def _get_dataset_sync(
+        self,
+        dataset_name: str,
+        caller_id: Optional[str] = None,
+        **params,
+    ) -> bytes:
+        """
+        Synchronous version of _get_dataset, with the same retries.
+
+        Args:
+            dataset_name: Name of the dataset (e.g., "responsiveness_1s")
+            caller_id: Override the default caller_id for this request
+            **params: Additional query parameters
+
+        Returns:
+            Raw JSON response body (a list of records)
+        """
+        endpoint, query_params = self._request_target(dataset_name, caller_id, params)
+        client = self._get_sync_client()
+        attempt = 0
+
+        while True:
+            try:
+                response = client.get(endpoint, params=query_params)
+            except _RETRY_ERRORS:
+                if attempt >= self.config.max_retries:
+                    raise
+                delay = _retry_delay(attempt)
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt >= self.config.max_retries
+                ):
+                    response.raise_for_status()
+                    return response.content
+                delay = _retry_delay(attempt, response)
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _request_target(
+        self, dataset_name: str, caller_id: Optional[str], params: Dict[str, Any]
+    ) -> tuple[str, httpx.QueryParams | Dict[str, Any]]:
+        """Get the path and query string for a dataset request"""
+        endpoint = _DATASET_PATHS.get(dataset_name)
+        if endpoint is None:
+            endpoint = f"{_DATASET_PREFIX}{dataset_name}.json"
+        return endpoint, self._query_params(caller_id, params)
+
+    async def _request_with_retry(
+        self, endpoint: str, params: httpx.QueryParams | Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        GET an endpoint, retrying transient failures.
+
+        Args:
+            endpoint: Request path, relative to base_url
+            params: Query parameters
+
+        Returns:
+            The successful response
+
+        Raises:
+            httpx.HTTPStatusError: If the final response is an error
+            httpx.ConnectError: If the sensor could not be reached
+        """
+        client = self._get_client()
+        loop = asyncio.get_running_loop()
+        attempt = 0
+
+        while True:
+            wait = self._next_allowed_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                response = await client.get(endpoint, params=params)
+            except _RETRY_ERRORS as e:
+                if attempt >= self.config.max_retries:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.debug("Retrying %s in %.1fs: %s", endpoint, delay, e)
+            else:
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt >= self.config.max_retries
+                ):
+                    response.raise_for_status()
+                    return response
+                delay = _retry_delay(attempt, response)
+                logger.debug(
+                    "Retrying %s in %.1fs: HTTP %s",
+                    endpoint,
+                    delay,
+                    response.status_code,
+                )
+
+            self._next_allowed_at = max(self._next_allowed_at, loop.time() + delay)
+            attempt += 1
+
+    async def _iter_lines(
+        self,
+        dataset_name: str,
+        caller_id: Optional[str] = None,
+        **params,
+    ) -> AsyncIterator[bytes]:
+        """Stream the JSON Lines form of a dataset, one raw record at a time"""
+        endpoint = f"{_DATASET_PREFIX}{dataset_name}.jsonl"
+        query_params = self._query_params(caller_id, params)
+
+        async with self._get_client().stream(
+            "GET", endpoint, params=query_params
+        ) as response:
             response.raise_for_status()
+            # Split the raw bytes on newlines and parse each line as bytes,
+            # rather than decoding the body to text first
+            pending = b""
+            async for chunk in response.aiter_bytes():
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield line
+            if pending.strip():
+                yield pending
+
+    def _query_params(
+        self, caller_id: Optional[str], params: Dict[str, Any]
+    ) -> httpx.QueryParams | Dict[str, Any]:
+        """Build the query string for a dataset request"""
+        if caller_id is None and not params:
+            return self._default_params
+        return {"id": caller_id or self.config.caller_id, **params}
+
+    async def _fetch_list(
+        self,
+        dataset_name: str,
+        model: type[RecordT],
+        caller_id: Optional[str],
+        validate: bool,
+        **params,
+    ) -> List[RecordT]:
+        """
+        Fetch a dataset and parse it into a list of records.
+
+        Args:
+            dataset_name: Name of the dataset (e.g., "responsiveness_1s")
+            model: Record model for the dataset
+            caller_id: Override the default caller_id for this request
+            validate: If False, build records with model_construct instead
+            **params: Additional query parameters
 
-            return response.json()
+        Returns:
+            List of model records
+        """
+        raw_data = await self._get_dataset(dataset_name, caller_id, **params)
+        return _parse_records(raw_data, model, validate)
 
     async def get_scores_1m(
         self,
         caller_id: Optional[str] = None,
+        validate: bool = True,
         **params,
     ) -> List[ScoreRecord]:
         """
@@ -181,6 +615,9 @@ class OrbAPIClient:
 
         Args:
             caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct. Faster for large batches, but values are
+                     not type-checked or coerced (default: True)
             **params: Additional query parameters
 
         Returns:
@@ -226,14 +663,15 @@ class OrbAPIClient:
             ...     avg = sum(scores_list) / len(scores_list)
             ...     print(f"{isp}: {avg:.1f}")
         """
-        request = DatasetRequestParams(caller_id=caller_id, **params)
-        raw_data = await self._get_dataset("scores_1m", request.caller_id, **params)
-        return [ScoreRecord(**record) for record in raw_data]
+        return await self._fetch_list(
+            "scores_1m", ScoreRecord, caller_id, validate, **params
+        )
 
     async def get_responsiveness(
         self,
         granularity: Literal["1s", "15s", "1m"] = "1m",
         caller_id: Optional[str] = None,
+        validate: bool = True,
         **params,
     ) -> List[ResponsivenessRecord]:
         """
@@ -245,6 +683,9 @@ class OrbAPIClient:
         Args:
             granularity: Time bucket size - "1s", "15s", or "1m"
             caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct. Faster for large batches, but values are
+                     not type-checked or coerced (default: True)
             **params: Additional query parameters
 
         Returns:
@@ -289,16 +730,19 @@ class OrbAPIClient:
             >>> max_loss = max(loss_rates)
             >>> print(f"Avg packet loss: {avg_loss:.2f}%, Max: {max_loss:.2f}%")
         """
-        request = ResponsivenessRequestParams(
-            granularity=granularity, caller_id=caller_id, **params
+        _check_granularity(granularity)
+        return await self._fetch_list(
+            f"responsiveness_{granularity}",
+            ResponsivenessRecord,
+            caller_id,
+            validate,
+            **params,
         )
-        dataset_name = f"responsiveness_{request.granularity}"
-        raw_data = await self._get_dataset(dataset_name, request.caller_id, **params)
-        return [ResponsivenessRecord(**record) for record in raw_data]
 
     async def get_web_responsiveness(
         self,
         caller_id: Optional[str] = None,
+        validate: bool = True,
         **params,
     ) -> List[WebResponsivenessRecord]:
         """
@@ -310,6 +754,9 @@ class OrbAPIClient:
 
         Args:
             caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct. Faster for large batches, but values are
+                     not type-checked or coerced (default: True)
             **params: Additional query parameters
 
         Returns:
@@ -356,15 +803,18 @@ class OrbAPIClient:
             ...     avg = sum(ttfbs) / len(ttfbs)
             ...     print(f"{url}: {avg:.1f}ms avg TTFB")
         """
-        request = DatasetRequestParams(caller_id=caller_id, **params)
-        raw_data = await self._get_dataset(
-            "web_responsiveness_results", request.caller_id, **params
+        return await self._fetch_list(
+            "web_responsiveness_results",
+            WebResponsivenessRecord,
+            caller_id,
+            validate,
+            **params,
         )
-        return [WebResponsivenessRecord(**record) for record in raw_data]
 
     async def get_speed_results(
         self,
         caller_id: Optional[str] = None,
+        validate: bool = True,
         **params,
     ) -> List[SpeedRecord]:
         """
@@ -375,6 +825,9 @@ class OrbAPIClient:
 
         Args:
             caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct. Faster for large batches, but values are
+                     not type-checked or coerced (default: True)
             **params: Additional query parameters
 
         Returns:
@@ -429,14 +882,15 @@ class OrbAPIClient:
             ...     avg = sum(speeds_list) / len(speeds_list)
             ...     print(f"{server}: {avg:.1f} Mbps avg")
         """
-        request = DatasetRequestParams(caller_id=caller_id, **params)
-        raw_data = await self._get_dataset("speed_results", request.caller_id, **params)
-        return [SpeedRecord(**record) for record in raw_data]
+        return await self._fetch_list(
+            "speed_results", SpeedRecord, caller_id, validate, **params
+        )
 
     async def get_wifi_link(
         self,
         granularity: Literal["1s", "15s", "1m"] = "1m",
         caller_id: Optional[str] = None,
+        validate: bool = True,
         **params,
     ) -> List[WifiLinkRecord]:
         """
@@ -451,6 +905,9 @@ class OrbAPIClient:
         Args:
             granularity: Time bucket size - "1s", "15s", or "1m"
             caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct. Faster for large batches, but values are
+                     not type-checked or coerced (default: True)
             **params: Additional query parameters
 
         Returns:
@@ -477,12 +934,167 @@ class OrbAPIClient:
             ...     print(f"{record.timestamp}: {record.rssi_avg} dBm "
             ...           f"on {record.channel_band}")
         """
-        request = ResponsivenessRequestParams(
-            granularity=granularity, caller_id=caller_id, **params
+        _check_granularity(granularity)
+        return await self._fetch_list(
+            f"wifi_link_{granularity}", WifiLinkRecord, caller_id, validate, **params
+        )
+
+    async def get_dataset_raw(
+        self,
+        dataset_name: str,
+        caller_id: Optional[str] = None,
+        **params,
+    ) -> bytes:
+        """
+        Retrieve a dataset as the raw JSON response body.
+
+        Skips parsing entirely, for callers that only forward the data, e.g.
+        writing it to a file or publishing it to a message broker.
+
+        Args:
+            dataset_name: Name of the dataset (e.g., "scores_1m",
+                         "responsiveness_1s", "speed_results")
+            caller_id: Override the default caller_id for this request
+            **params: Additional query parameters
+
+        Returns:
+            JSON array of records, as bytes
+
+        Raises:
+            ValueError: If dataset_name is not a known dataset
+
+        Examples:
+            Append new speed test results to a file:
+
+            >>> client = OrbAPIClient(host="192.168.1.100")
+            >>> body = await client.get_dataset_raw("speed_results")
+            >>> with open("speed_results.json", "ab") as f:
+            ...     f.write(body)
+        """
+        if dataset_name not in _DATASET_PATHS:
+            raise ValueError(
+                f"Unknown dataset: {dataset_name}. "
+                f"Valid options: {', '.join(_DATASET_PATHS)}"
+            )
+        return await self._get_dataset(dataset_name, caller_id, **params)
+
+    async def stream_dataset(
+        self,
+        dataset_name: str,
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Stream a dataset's records as they arrive.
+
+        Unlike the get_* methods, which wait for the whole response and
+        return a list, this parses one record at a time from the JSON Lines
+        form of the dataset. Memory use stays flat however many records the
+        sensor sends, e.g. on the first poll of a new caller_id, and records
+        can be processed while the rest are still being received.
+
+        Args:
+            dataset_name: Name of the dataset (e.g., "scores_1m",
+                         "responsiveness_1s", "speed_results")
+            caller_id: Override the default caller_id for this request
+            validate: If False, skip validation and build records with
+                     model_construct (see get_scores_1m)
+            **params: Additional query parameters
+
+        Yields:
+            Records of the dataset's model type (e.g., ScoreRecord)
+
+        Raises:
+            ValueError: If dataset_name is not a known dataset
+
+        Examples:
+            Process a large first poll without holding it all in memory:
+
+            >>> async for record in client.stream_dataset("responsiveness_1s"):
+            ...     print(f"{record.timestamp}: {record.lag_avg_us} μs")
+        """
+        model = _DATASET_MODELS.get(dataset_name)
+        if model is None:
+            raise ValueError(
+                f"Unknown dataset: {dataset_name}. "
+                f"Valid options: {', '.join(_DATASET_MODELS)}"
+            )
+
+        async for line in self._iter_lines(dataset_name, caller_id, **params):
+            if validate:
+                yield model.model_validate_json(line)
+            else:
+                yield model.model_construct(**from_json(line))
+
+    def get_scores_1m_sync(
+        self,
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> List[ScoreRecord]:
+        """
+        Synchronous version of get_scores_1m.
+
+        For scripts and cron jobs without an event loop, where wrapping each
+        call in asyncio.run() would build and tear down a loop every time.
+
+        Examples:
+            >>> with OrbAPIClient(host="192.168.1.100") as client:
+            ...     scores = client.get_scores_1m_sync()
+        """
+        raw_data = self._get_dataset_sync("scores_1m", caller_id, **params)
+        return _parse_records(raw_data, ScoreRecord, validate)
+
+    def get_responsiveness_sync(
+        self,
+        granularity: Literal["1s", "15s", "1m"] = "1m",
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> List[ResponsivenessRecord]:
+        """Synchronous version of get_responsiveness"""
+        _check_granularity(granularity)
+        raw_data = self._get_dataset_sync(
+            f"responsiveness_{granularity}", caller_id, **params
+        )
+        return _parse_records(raw_data, ResponsivenessRecord, validate)
+
+    def get_web_responsiveness_sync(
+        self,
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> List[WebResponsivenessRecord]:
+        """Synchronous version of get_web_responsiveness"""
+        raw_data = self._get_dataset_sync(
+            "web_responsiveness_results", caller_id, **params
         )
-        dataset_name = f"wifi_link_{request.granularity}"
-        raw_data = await self._get_dataset(dataset_name, request.caller_id, **params)
-        return [WifiLinkRecord(**record) for record in raw_data]
+        return _parse_records(raw_data, WebResponsivenessRecord, validate)
+
+    def get_speed_results_sync(
+        self,
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> List[SpeedRecord]:
+        """Synchronous version of get_speed_results"""
+        raw_data = self._get_dataset_sync("speed_results", caller_id, **params)
+        return _parse_records(raw_data, SpeedRecord, validate)
+
+    def get_wifi_link_sync(
+        self,
+        granularity: Literal["1s", "15s", "1m"] = "1m",
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        **params,
+    ) -> List[WifiLinkRecord]:
+        """Synchronous version of get_wifi_link"""
+        _check_granularity(granularity)
+        raw_data = self._get_dataset_sync(
+            f"wifi_link_{granularity}", caller_id, **params
+        )
+        return _parse_records(raw_data, WifiLinkRecord, validate)
 
     async def get_all_datasets(
         self,
@@ -490,6 +1102,8 @@ class OrbAPIClient:
         include_all_responsiveness: bool = False,
         include_all_wifi_link: bool = False,
         default_granularity: Literal["1s", "15s", "1m"] = "1m",
+        validate: bool = True,
+        max_concurrency: Optional[int] = None,
     ) -> AllDatasetsResponse:
         """
         Retrieve all datasets concurrently.
@@ -504,6 +1118,10 @@ class OrbAPIClient:
                                    default granularity.
             default_granularity: Base granularity to fetch when not including all
                                  granularities (default: '1m').
+            validate: If False, skip record validation (see get_scores_1m)
+            max_concurrency: Maximum number of requests to have in flight at
+                             once (default: no limit). Useful for sensors on
+                             constrained hardware.
 
         Returns:
             AllDatasetsResponse object with fields for each dataset type
@@ -558,44 +1176,155 @@ class OrbAPIClient:
             ...     else:
             ...         print(f"{name}: {len(data)} records")
         """
-        request = AllDatasetsRequestParams(
-            caller_id=caller_id,
-            include_all_responsiveness=include_all_responsiveness,
-            include_all_wifi_link=include_all_wifi_link,
+        fetches = self._all_dataset_fetches(
+            caller_id,
+            include_all_responsiveness,
+            include_all_wifi_link,
+            default_granularity,
+            validate,
+        )
+
+        limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        async with asyncio.TaskGroup() as tg:
+            handles = [
+                tg.create_task(_settle(key, fetch, limit))
+                for key, fetch in fetches.items()
+            ]
+
+        # The getters already produced records, so skip validating them again
+        datasets: Dict[str, Any] = dict(h.result() for h in handles)
+        return AllDatasetsResponse.model_construct(**datasets)
+
+    async def iter_all_datasets(
+        self,
+        caller_id: Optional[str] = None,
+        include_all_responsiveness: bool = False,
+        include_all_wifi_link: bool = False,
+        default_granularity: Literal["1s", "15s", "1m"] = "1m",
+        validate: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[tuple[str, List[Any] | Dict[str, str]]]:
+        """
+        Retrieve all datasets concurrently, yielding each one as it arrives.
+
+        Takes the same arguments as get_all_datasets, but rather than waiting
+        for the slowest dataset, yields (name, records) pairs in completion
+        order. A dataset that failed is yielded as (name, {"error": message}).
+        Fetches still in flight are cancelled if iteration stops early.
+
+        Examples:
+            Update a display as soon as each dataset is available:
+
+            >>> async for name, data in client.iter_all_datasets():
+            ...     print(f"{name}: {len(data)} records")
+        """
+        fetches = self._all_dataset_fetches(
+            caller_id,
+            include_all_responsiveness,
+            include_all_wifi_link,
+            default_granularity,
+            validate,
         )
+        async for result in _settle_as_completed(fetches, max_concurrency):
+            yield result
+
+    async def iter_datasets(
+        self,
+        dataset_names: Iterable[str],
+        caller_id: Optional[str] = None,
+        validate: bool = True,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[tuple[str, List[Any] | Dict[str, str]]]:
+        """
+        Retrieve the named datasets concurrently, yielding each one as it arrives.
+
+        Like iter_all_datasets, but for any selection of the datasets that
+        poll_dataset accepts. A dataset that failed is yielded as
+        (name, {"error": message}), and fetches still in flight are cancelled
+        if iteration stops early.
 
+        Args:
+            dataset_names: Names of the datasets to fetch (e.g., "scores_1m",
+                          "responsiveness_1s", "wifi_link_15s")
+            caller_id: Override the default caller_id for these requests
+            validate: If False, skip record validation (see get_scores_1m)
+            max_concurrency: Maximum number of requests to have in flight at
+                             once (default: no limit)
+
+        Yields:
+            (dataset_name, records) pairs in completion order
+
+        Raises:
+            ValueError: If any dataset name is not recognized
+
+        Examples:
+            Fetch every granularity of one dataset, two requests at a time:
+
+            >>> names = ["wifi_link_1s", "wifi_link_15s", "wifi_link_1m"]
+            >>> async for name, data in client.iter_datasets(
+            ...     names, max_concurrency=2
+            ... ):
+            ...     print(f"{name}: {len(data)} records")
+        """
+        fetches: Dict[str, Callable[[], Awaitable[List[Any]]]] = {}
+        for name in dataset_names:
+            if name not in _POLLABLE_DATASETS:
+                raise ValueError(
+                    f"Unknown dataset: {name}. "
+                    f"Valid options: {', '.join(_POLLABLE_DATASETS)}"
+                )
+            method_name, args = _POLLABLE_DATASETS[name]
+            fetches[name] = functools.partial(
+                getattr(self, method_name),
+                *args,
+                caller_id=caller_id,
+                validate=validate,
+            )
+
+        async for result in _settle_as_completed(fetches, max_concurrency):
+            yield result
+
+    def _all_dataset_fetches(
+        self,
+        caller_id: Optional[str],
+        include_all_responsiveness: bool,
+        include_all_wifi_link: bool,
+        default_granularity: Literal["1s", "15s", "1m"],
+        validate: bool,
+    ) -> Dict[str, Callable[[], Awaitable[List[Any]]]]:
+        """Build the dataset fetches for get_all_datasets, keyed by field name"""
+        # Fetches are started only when run, so none is left unawaited if it
+        # never gets a concurrency slot
+        partial = functools.partial
         gran = default_granularity
-        tasks = {
-            "scores_1m": self.get_scores_1m(request.caller_id),
-            f"responsiveness_{gran}": self.get_responsiveness(gran, request.caller_id),
-            "web_responsiveness": self.get_web_responsiveness(request.caller_id),
-            "speed_results": self.get_speed_results(request.caller_id),
-            f"wifi_link_{gran}": self.get_wifi_link(gran, request.caller_id),
+        tasks: Dict[str, Callable[[], Awaitable[List[Any]]]] = {
+            "scores_1m": partial(self.get_scores_1m, caller_id, validate),
+            f"responsiveness_{gran}": partial(
+                self.get_responsiveness, gran, caller_id, validate
+            ),
+            "web_responsiveness": partial(
+                self.get_web_responsiveness, caller_id, validate
+            ),
+            "speed_results": partial(self.get_speed_results, caller_id, validate),
+            f"wifi_link_{gran}": partial(self.get_wifi_link, gran, caller_id, validate),
         }
 
         all_granularities: set[Literal["1s", "15s", "1m"]] = {"1s", "15s", "1m"}
         other_granularities = sorted(all_granularities - {gran})
 
-        if request.include_all_responsiveness:
+        if include_all_responsiveness:
             for g in other_granularities:
-                tasks[f"responsiveness_{g}"] = self.get_responsiveness(
-                    g, request.caller_id
+                tasks[f"responsiveness_{g}"] = partial(
+                    self.get_responsiveness, g, caller_id, validate
                 )
 
-        if request.include_all_wifi_link:
+        if include_all_wifi_link:
             for g in other_granularities:
-                tasks[f"wifi_link_{g}"] = self.get_wifi_link(g, request.caller_id)
-
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-
-        result_dict = {
-            key: result
-            if not isinstance(result, BaseException)
-            else {"error": str(result)}
-            for key, result in zip(tasks.keys(), results, strict=True)
-        }
+                tasks[f"wifi_link_{g}"] = partial(
+                    self.get_wifi_link, g, caller_id, validate
+                )
 
-        return AllDatasetsResponse(**result_dict)
+        return tasks
 
     async def poll_dataset(
         self,
@@ -603,6 +1332,8 @@ class OrbAPIClient:
         interval: float = 60.0,
         callback: Optional[Callable] = None,
         max_iterations: Optional[int] = None,
+        validate: bool = True,
+        offload_sync_callback: bool = False,
     ):
         """
         Continuously poll a dataset at regular intervals.
@@ -616,6 +1347,10 @@ class OrbAPIClient:
             callback: Optional function to call with each batch of new records.
                      Should accept (dataset_name, records) as arguments.
             max_iterations: Maximum number of polls (None for infinite)
+            validate: If False, skip record validation (see get_scores_1m)
+            offload_sync_callback: If True, run a synchronous callback in a worker
+                     thread so slow callbacks (e.g., writing files) don't
+                     block the event loop
 
         Yields:
             Each batch of new records as Pydantic objects
@@ -700,45 +1435,48 @@ class OrbAPIClient:
             max_iterations=max_iterations,
         )
 
-        # Map dataset names to their respective fetch methods
-        dataset_methods = {
-            "scores_1m": lambda: self.get_scores_1m(),
-            "responsiveness_1s": lambda: self.get_responsiveness("1s"),
-            "responsiveness_15s": lambda: self.get_responsiveness("15s"),
-            "responsiveness_1m": lambda: self.get_responsiveness("1m"),
-            "web_responsiveness_results": lambda: self.get_web_responsiveness(),
-            "speed_results": lambda: self.get_speed_results(),
-            "wifi_link_1s": lambda: self.get_wifi_link("1s"),
-            "wifi_link_15s": lambda: self.get_wifi_link("15s"),
-            "wifi_link_1m": lambda: self.get_wifi_link("1m"),
-        }
-
-        if config.dataset_name not in dataset_methods:
+        if config.dataset_name not in _POLLABLE_DATASETS:
             raise ValueError(
                 f"Unknown dataset: {config.dataset_name}. "
-                f"Valid options: {', '.join(dataset_methods.keys())}"
+                f"Valid options: {', '.join(_POLLABLE_DATASETS)}"
             )
 
-        fetch_method = dataset_methods[config.dataset_name]
+        method_name, args = _POLLABLE_DATASETS[config.dataset_name]
+        fetch_method = functools.partial(
+            getattr(self, method_name), *args, validate=validate
+        )
+        callback = config.callback
+        is_async_callback = inspect.iscoroutinefunction(callback)
 
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
         iteration = 0
         while config.max_iterations is None or iteration < config.max_iterations:
             try:
                 records = await fetch_method()
 
-                if config.callback and records:
-                    await config.callback(
-                        config.dataset_name, records
-                    ) if asyncio.iscoroutinefunction(
-                        config.callback
-                    ) else config.callback(config.dataset_name, records)
+                if callback and records:
+                    if is_async_callback:
+                        await callback(config.dataset_name, records)
+                    elif offload_sync_callback:
+                        await _run_in_thread(callback, config.dataset_name, records)
+                    else:
+                        callback(config.dataset_name, records)
 
                 yield records
 
-                await asyncio.sleep(config.interval)
-                iteration += 1
-
             except Exception as e:
                 logger.warning("Error polling %s: %s", config.dataset_name, e)
-                await asyncio.sleep(config.interval)
-                iteration += 1
+
+            iteration += 1
+            # No need to wait once the final poll is done
+            if config.max_iterations is None or iteration < config.max_iterations:
+                # Sleep until the next scheduled poll rather than a full interval,
+                # so time spent fetching doesn't make the cadence drift
+                next_poll += config.interval
+                delay = next_poll - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # Already behind schedule, so poll now and restart from here
+                    next_poll = loop.time()
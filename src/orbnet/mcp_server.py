@@ -7,24 +7,50 @@ Uses the orbnet package to retrieve data from Orb sensors.
 Stateful Polling:
     This server uses a fixed caller_id for the lifetime of the server process.
     This means:
-    - First query returns all available historical data
+    - First query returns data collected since the server started (tools accept
+      since=0 to return the sensor's full history). With ORB_CALLER_ID set, it
+      returns everything the sensor has not yet returned to that caller_id,
+      including data collected while the server was down
     - Subsequent queries in the same session return only new data
-    - Server restart generates a new caller_id and starts fresh
+    - Server restart generates a new caller_id and starts fresh, unless one is
+      set with the ORB_CALLER_ID environment variable
 
     You can override the default caller_id in any tool call if you need different
     polling behavior.
 """
 
+import asyncio
+import functools
+import importlib.util
+import inspect
+import logging
 import os
-import uuid
-from typing import Any, Dict, List, Literal, Optional
+import secrets
+import statistics
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+)
 
-from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+import anyio
+import httpx
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from pydantic import BaseModel, ConfigDict, Field
 
 from .client import OrbAPIClient
 from .models import (
     AllDatasetsResponse,
+    BaseIdentifiers,
     ResponsivenessRecord,
     ScoreRecord,
     SpeedRecord,
@@ -32,20 +58,68 @@ from .models import (
     WifiLinkRecord,
 )
 
+logger = logging.getLogger(__name__)
+
+# Clients shared across tool calls, keyed by their settings, so each sensor's
+# connection pool is reused from one poll to the next. Tool arguments choose
+# the key, so only the most recently used _MAX_CLIENTS are kept.
+_MAX_CLIENTS = 16
+_clients: Dict[tuple[str, int, str, float], OrbAPIClient] = {}
+# Evicted clients whose connection pools are still closing
+_closing: set[asyncio.Task[None]] = set()
+
+
+def _evict(client: OrbAPIClient) -> None:
+    """Close a client dropped from the cache."""
+    try:
+        task = asyncio.get_running_loop().create_task(client.aclose())
+    except RuntimeError:
+        # No event loop, so the client can only have a synchronous pool open
+        client.close()
+        return
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def close_clients() -> None:
+    """Close and forget every cached client."""
+    while _clients:
+        _, client = _clients.popitem()
+        await client.aclose()
+    if _closing:
+        await asyncio.gather(*_closing)
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncGenerator[None, None]:
+    """Close the cached clients' connection pools when the server stops."""
+    try:
+        yield
+    finally:
+        await close_clients()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "Orb Network Quality Data",
-    instructions="""
+    instructions=inspect.cleandoc("""
     This server provides real-time network quality monitoring from Orb sensors.
 
     **What You Can Ask:**
     ✓ "What's my current network quality?"
     ✓ "Why is my internet slow right now?"
-    ✓ "Show me speed test history from today"
+    ✓ "Show me speed test history from today" (see History below)
     ✓ "Is my connection good enough for video calls?"
-    ✓ "Compare my network quality from yesterday vs today"
+    ✓ "Compare my network quality from yesterday vs today" (see History below)
     ✓ "Summarize network quality across all of my orbs"
 
+    **History:**
+    By default, tools only return data collected since this server started,
+    unless ORB_CALLER_ID is set. The sensor returns each record only once per
+    caller_id, so to look further back (e.g., today's speed tests), pass since
+    as epoch milliseconds (0 for everything the sensor has) together with a new
+    caller_id.
+
     **Primary Metrics:**
     - Orb Score (0-100): Overall network health
     - Responsiveness: Latency, jitter, packet loss
@@ -70,6 +144,7 @@ mcp = FastMCP(
     then "1m" before concluding that Wi-Fi link data is unavailable.
 
     **Tool Selection Guide:**
+    - How's my network? → get_summary() (start here: a few statistics and flags)
     - Quick check? → get_scores_1m() (fastest, gives overall picture)
     - Detailed troubleshooting? → get_all_datasets() (comprehensive)
     - Video call problems? → get_responsiveness() (latency/jitter focus)
@@ -92,7 +167,8 @@ mcp = FastMCP(
     the user, so the results may not be representative of the network
     quality that the user is experiencing. Be sure to attribute the
     results to the Orb, not the user.
-    """,  # noqa: E501
+    """),  # noqa: E501
+    lifespan=_lifespan,
 )
 
 
@@ -106,16 +182,22 @@ class OrbSensorConfig(BaseModel):
     )
 
     # Default caller_id for the session
-    caller_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    caller_id: str = Field(default_factory=lambda: secrets.token_hex(12))
+
+    model_config = ConfigDict(frozen=True)
 
     @classmethod
+    @functools.cache
     def from_env(cls) -> "OrbSensorConfig":
-        """Load configuration from environment variables"""
-        return cls(
-            host=os.getenv("ORB_HOST", "localhost"),
-            port=int(os.getenv("ORB_PORT", "7080")),
-            timeout=float(os.getenv("ORB_TIMEOUT", "30.0")),
-        )
+        """Load configuration from environment variables (once per process)"""
+        settings: Dict[str, Any] = {
+            "host": os.getenv("ORB_HOST", "localhost"),
+            "port": int(os.getenv("ORB_PORT", "7080")),
+            "timeout": float(os.getenv("ORB_TIMEOUT", "30.0")),
+        }
+        if caller_id := os.getenv("ORB_CALLER_ID"):
+            settings["caller_id"] = caller_id
+        return cls(**settings)
 
 
 config = OrbSensorConfig.from_env()
@@ -127,12 +209,145 @@ def get_client(
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
 ) -> OrbAPIClient:
-    """Create an OrbAPIClient with config defaults and optional overrides."""
-    return OrbAPIClient(
-        host=host or config.host,
-        port=port or config.port,
-        caller_id=caller_id or config.caller_id,
-        timeout=timeout or config.timeout,
+    """Get the shared OrbAPIClient for config defaults and optional overrides."""
+    key = (
+        host or config.host,
+        port or config.port,
+        caller_id or config.caller_id,
+        timeout or config.timeout,
+    )
+    client = _clients.pop(key, None)
+    if client is None:
+        host, port, caller_id, timeout = key
+        client = OrbAPIClient(
+            host=host, port=port, caller_id=caller_id, timeout=timeout
+        )
+        if len(_clients) >= _MAX_CLIENTS:
+            _evict(_clients.pop(next(iter(_clients))))
+    # Dicts keep insertion order, so re-inserting marks this most recently used
+    _clients[key] = client
+    return client
+
+
+T = TypeVar("T")
+RecordT = TypeVar("RecordT", bound=BaseIdentifiers)
+
+# By default tools only return records collected since the server started, at
+# most _DEFAULT_LIMIT per dataset, so a first poll doesn't return the sensor's
+# entire history. The sensor has already moved the caller_id past any record
+# dropped here, so with a caller_id that persists across restarts
+# (ORB_CALLER_ID) there is no default cutoff: records collected while the
+# server was down are still new to it.
+_SERVER_START_MS = time.time_ns() // 1_000_000
+_DEFAULT_SINCE = 0 if os.getenv("ORB_CALLER_ID") else _SERVER_START_MS
+_DEFAULT_LIMIT = 500
+
+# Tool requests in flight, keyed by client and call. Identical concurrent tool
+# calls share one request to the sensor. A finished result is never reused,
+# since the sensor only returns each record once per caller_id.
+_in_flight: Dict[tuple[Any, ...], "asyncio.Future[Any]"] = {}
+
+
+async def _single_flight(key: tuple[Any, ...], fetch: Callable[[], Awaitable[T]]) -> T:
+    """Run fetch, or wait for an identical fetch that is already running."""
+    task = _in_flight.get(key)
+    if task is None or task.done():
+        task = _in_flight[key] = asyncio.ensure_future(fetch())
+
+        def forget(done: "asyncio.Future[Any]") -> None:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+        task.add_done_callback(forget)
+    # Shield so one caller giving up doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+# After this many consecutive connection failures, tool calls for that sensor
+# fail immediately for _CIRCUIT_COOLDOWN seconds rather than each waiting out
+# a timeout, so an LLM retrying against a sensor that's down gets a quick
+# answer
+_CIRCUIT_THRESHOLD = 3
+_CIRCUIT_COOLDOWN = 5.0
+# (consecutive failures, time.monotonic() until which calls fail fast)
+_circuits: Dict[tuple[str, int], tuple[int, float]] = {}
+
+
+def _all_failed(result: Any) -> bool:
+    """Whether result is an all-datasets response in which every fetch failed."""
+    if not isinstance(result, AllDatasetsResponse):
+        return False
+    datasets = [value for _, value in result if value is not None]
+    return bool(datasets) and all(isinstance(value, dict) for value in datasets)
+
+
+def _record_failure(key: tuple[str, int]) -> None:
+    """Count a failed call to a sensor, opening its circuit at the threshold."""
+    failures, open_until = _circuits.get(key, (0, 0.0))
+    failures += 1
+    if failures >= _CIRCUIT_THRESHOLD:
+        open_until = time.monotonic() + _CIRCUIT_COOLDOWN
+    _circuits[key] = (failures, open_until)
+
+
+async def _guarded(client: OrbAPIClient, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Run fetch unless the sensor has recently been unreachable."""
+    key = (client.host, client.port)
+    _, open_until = _circuits.get(key, (0, 0.0))
+    wait = open_until - time.monotonic()
+    if wait > 0:
+        raise ToolError(
+            f"Orb sensor {client.host}:{client.port} is unreachable; "
+            f"not retrying for another {wait:.0f}s"
+        )
+
+    try:
+        result = await fetch()
+    except httpx.TransportError:
+        _record_failure(key)
+        raise
+
+    # get_all_datasets reports each dataset's failure in its response rather
+    # than raising, so a response with nothing but errors counts as a failure
+    if _all_failed(result):
+        _record_failure(key)
+    else:
+        _circuits.pop(key, None)
+    return result
+
+
+async def _fetch(
+    client: OrbAPIClient, key: tuple[Any, ...], fetch: Callable[[], Awaitable[T]]
+) -> T:
+    """Fetch from a sensor, sharing identical in-flight calls."""
+    return await _single_flight(
+        (client, *key), functools.partial(_guarded, client, fetch)
+    )
+
+
+def _trim(
+    records: List[RecordT], since: Optional[int], limit: Optional[int]
+) -> List[RecordT]:
+    """Keep the newest ``limit`` records with a timestamp at or after ``since``."""
+    if since is None:
+        since = _DEFAULT_SINCE
+    if since:
+        records = [record for record in records if record.timestamp >= since]
+    if limit is not None and len(records) > limit:
+        records = records[len(records) - limit :]
+    return records
+
+
+def _trim_all(
+    response: AllDatasetsResponse, since: Optional[int], limit: Optional[int]
+) -> AllDatasetsResponse:
+    """Apply :func:`_trim` to each dataset in an all-datasets response."""
+    return response.model_copy(
+        update={
+            name: _trim(value, since, limit)
+            for name, value in response
+            if isinstance(value, list)
+        }
     )
 
 
@@ -145,11 +360,12 @@ def get_client(
     }
 )
 async def get_scores_1m(
-    ctx: Context,
     host: Optional[str] = None,
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> List[ScoreRecord]:
     """
     Retrieve 1-minute granularity Scores dataset from an Orb sensor.
@@ -178,9 +394,11 @@ async def get_scores_1m(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         host: Orb sensor hostname or IP (default: from ORB_HOST env var or 'localhost')
@@ -188,6 +406,12 @@ async def get_scores_1m(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         List of score records, each containing:
@@ -223,9 +447,10 @@ async def get_scores_1m(
             }
         ]
     """
-    await ctx.info(f"Getting 1m scores from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_scores_1m()
+    logger.debug("Getting 1m scores from Orb sensor %s", client.host)
+    records = await _fetch(client, ("scores_1m",), client.get_scores_1m)
+    return _trim(records, since, limit)
 
 
 @mcp.tool(
@@ -237,12 +462,13 @@ async def get_scores_1m(
     }
 )
 async def get_responsiveness(
-    ctx: Context,
     host: Optional[str] = None,
     granularity: Literal["1s", "15s", "1m"] = "1s",
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> List[ResponsivenessRecord]:
     """
     Retrieve Responsiveness dataset from an Orb sensor at a single granularity.
@@ -259,9 +485,11 @@ async def get_responsiveness(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         granularity: Time bucket size - '1s', '15s', or '1m' (default: '1s')
@@ -270,6 +498,12 @@ async def get_responsiveness(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         List of responsiveness records, each containing:
@@ -302,9 +536,14 @@ async def get_responsiveness(
 
     Empty list [] if no new data since last poll.
     """
-    await ctx.info(f"Getting responsiveness data from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_responsiveness(granularity=granularity)
+    logger.debug("Getting responsiveness data from Orb sensor %s", client.host)
+    records = await _fetch(
+        client,
+        ("responsiveness", granularity),
+        functools.partial(client.get_responsiveness, granularity=granularity),
+    )
+    return _trim(records, since, limit)
 
 
 @mcp.tool(
@@ -316,11 +555,12 @@ async def get_responsiveness(
     }
 )
 async def get_web_responsiveness(
-    ctx: Context,
     host: Optional[str] = None,
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> List[WebResponsivenessRecord]:
     """
     Retrieve Web Responsiveness dataset from an Orb sensor.
@@ -330,9 +570,11 @@ async def get_web_responsiveness(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         host: Orb sensor hostname or IP (default: from ORB_HOST env var or 'localhost')
@@ -340,6 +582,12 @@ async def get_web_responsiveness(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         List of web responsiveness records, each containing:
@@ -350,9 +598,12 @@ async def get_web_responsiveness(
         - network_type: Network interface type
         - And more...
     """
-    await ctx.info(f"Getting web responsiveness data from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_web_responsiveness()
+    logger.debug("Getting web responsiveness data from Orb sensor %s", client.host)
+    records = await _fetch(
+        client, ("web_responsiveness",), client.get_web_responsiveness
+    )
+    return _trim(records, since, limit)
 
 
 @mcp.tool(
@@ -364,11 +615,12 @@ async def get_web_responsiveness(
     }
 )
 async def get_speed_results(
-    ctx: Context,
     host: Optional[str] = None,
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> List[SpeedRecord]:
     """
     Retrieve Speed test results dataset from an Orb sensor.
@@ -378,9 +630,11 @@ async def get_speed_results(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         host: Orb sensor hostname or IP (default: from ORB_HOST env var or 'localhost')
@@ -388,6 +642,12 @@ async def get_speed_results(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         List of speed test records, each containing:
@@ -398,9 +658,10 @@ async def get_speed_results(
         - timestamp: Test timestamp in epoch milliseconds
         - network_type: Network interface type
     """
-    await ctx.info(f"Getting speed test data from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_speed_results()
+    logger.debug("Getting speed test data from Orb sensor %s", client.host)
+    records = await _fetch(client, ("speed_results",), client.get_speed_results)
+    return _trim(records, since, limit)
 
 
 @mcp.tool(
@@ -412,12 +673,13 @@ async def get_speed_results(
     }
 )
 async def get_wifi_link(
-    ctx: Context,
     host: Optional[str] = None,
     granularity: Literal["1s", "15s", "1m"] = "1s",
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> List[WifiLinkRecord]:
     """
     Retrieve Wi-Fi Link dataset from an Orb sensor at a single granularity.
@@ -439,9 +701,11 @@ async def get_wifi_link(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         granularity: Time bucket size - '1s', '15s', or '1m' (default: '1s')
@@ -450,6 +714,12 @@ async def get_wifi_link(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         List of Wi-Fi link records, each containing:
@@ -474,9 +744,14 @@ async def get_wifi_link(
         "Why is my Wi-Fi slow even though my internet plan is fast?"
         "Show me my Wi-Fi signal strength over the last hour"
     """
-    await ctx.info(f"Getting Wi-Fi link data from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_wifi_link(granularity=granularity)
+    logger.debug("Getting Wi-Fi link data from Orb sensor %s", client.host)
+    records = await _fetch(
+        client,
+        ("wifi_link", granularity),
+        functools.partial(client.get_wifi_link, granularity=granularity),
+    )
+    return _trim(records, since, limit)
 
 
 @mcp.tool(
@@ -488,13 +763,14 @@ async def get_wifi_link(
     }
 )
 async def get_all_datasets(
-    ctx: Context,
     host: Optional[str] = None,
     include_all_responsiveness: bool = False,
     include_all_wifi_link: bool = False,
     port: Optional[int] = None,
     caller_id: Optional[str] = None,
     timeout: Optional[float] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = _DEFAULT_LIMIT,
 ) -> AllDatasetsResponse:
     """
     Retrieve all available datasets from an Orb sensor concurrently.
@@ -504,9 +780,11 @@ async def get_all_datasets(
 
     Note on Stateful Polling:
         By default, this tool uses a session-specific caller_id. This means your
-        first call returns all available data, and subsequent calls return only
-        new data collected since the last call. This makes it efficient to check
-        for updates without receiving duplicate records.
+        first call returns data collected since the server started (or, if
+        ORB_CALLER_ID is set, everything the sensor has not yet returned to it),
+        and subsequent calls return only new data collected since the last call.
+        This makes it efficient to check for updates without receiving duplicate
+        records. Records skipped by since or limit are not returned later.
 
     Args:
         include_all_responsiveness: If True, fetches all responsiveness granularities
@@ -520,6 +798,12 @@ async def get_all_datasets(
         caller_id: Unique ID to track polling state. Leave as None to use the default
                    session-specific ID, or provide your own for custom polling behavior.
         timeout: Request timeout in seconds (default: 30.0)
+        since: Only return records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+        limit: Maximum number of records to return per dataset, keeping the
+               newest (default: 500). Pass None for no limit.
 
     Returns:
         Dictionary with keys for each dataset type:
@@ -537,13 +821,180 @@ async def get_all_datasets(
 
         Each value is either a list of records or an error dict if that dataset failed.
     """
-    await ctx.info(f"Getting all datasets from Orb sensor {host}...")
     client = get_client(host, port, caller_id, timeout)
-    return await client.get_all_datasets(
-        include_all_responsiveness=include_all_responsiveness,
-        include_all_wifi_link=include_all_wifi_link,
-        default_granularity="1s",
+    logger.debug("Getting all datasets from Orb sensor %s", client.host)
+    response = await _fetch(
+        client,
+        ("all_datasets", include_all_responsiveness, include_all_wifi_link),
+        functools.partial(
+            client.get_all_datasets,
+            include_all_responsiveness=include_all_responsiveness,
+            include_all_wifi_link=include_all_wifi_link,
+            default_granularity="1s",
+        ),
+    )
+    return _trim_all(response, since, limit)
+
+
+# Thresholds for the get_summary problem flags, matching the typical values
+# given in the troubleshooting prompts
+_HIGH_LATENCY_US = 50_000
+_HIGH_JITTER_US = 10_000
+_HIGH_PACKET_LOSS_PCT = 1.0
+_WEAK_WIFI_RSSI_DBM = -75.0
+
+
+class Percentiles(BaseModel):
+    """Percentiles of a measure over the summarized records"""
+
+    p50: float
+    p95: float
+    p99: float
+
+
+class NetworkSummary(BaseModel):
+    """Summary statistics returned by the get_summary tool"""
+
+    orb_score_mean: Optional[float] = Field(description="Mean Orb Score (0-100)")
+    latency_us: Optional[Percentiles] = Field(
+        description="Round trip latency in microseconds"
+    )
+    jitter_us: Optional[Percentiles] = Field(description="Jitter in microseconds")
+    packet_loss_pct: Optional[Percentiles] = Field(description="Packet loss percent")
+    download_kbps_mean: Optional[float] = Field(
+        description="Mean speed test download speed in Kbps"
+    )
+    upload_kbps_mean: Optional[float] = Field(
+        description="Mean speed test upload speed in Kbps"
+    )
+    rssi_avg_mean: Optional[float] = Field(
+        description="Mean Wi-Fi signal strength in dBm (None if not on Wi-Fi)"
     )
+    high_latency: bool = Field(description="p95 latency is 50 ms or more")
+    high_jitter: bool = Field(description="p95 jitter is 10 ms or more")
+    high_packet_loss: bool = Field(description="Mean packet loss is 1% or more")
+    wifi_weak: bool = Field(description="Mean RSSI is below -75 dBm")
+    unavailable: List[str] = Field(
+        description="Datasets that could not be fetched, e.g. a disabled granularity"
+    )
+
+
+def _values(records: Any, field: str) -> List[float]:
+    """Values of a field across a dataset, or [] if the dataset failed."""
+    if not isinstance(records, list):
+        return []
+    return [
+        value for record in records if (value := getattr(record, field)) is not None
+    ]
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    """Mean of the values, or None if there are none."""
+    return statistics.fmean(values) if values else None
+
+
+def _percentiles(values: List[float]) -> Optional[Percentiles]:
+    """p50, p95, and p99 of the values, or None if there are none."""
+    if not values:
+        return None
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return Percentiles(p50=cuts[49], p95=cuts[94], p99=cuts[98])
+
+
+def _summarize(datasets: AllDatasetsResponse, granularity: str) -> NetworkSummary:
+    """Reduce an all-datasets response to a handful of statistics and flags."""
+    responsiveness = getattr(datasets, f"responsiveness_{granularity}")
+    wifi_link = getattr(datasets, f"wifi_link_{granularity}")
+    latency = _percentiles(_values(responsiveness, "latency_avg_us"))
+    jitter = _percentiles(_values(responsiveness, "jitter_avg_us"))
+    packet_loss = _values(responsiveness, "packet_loss_pct")
+    rssi = _mean(_values(wifi_link, "rssi_avg"))
+    return NetworkSummary(
+        orb_score_mean=_mean(_values(datasets.scores_1m, "orb_score")),
+        latency_us=latency,
+        jitter_us=jitter,
+        packet_loss_pct=_percentiles(packet_loss),
+        download_kbps_mean=_mean(_values(datasets.speed_results, "download_kbps")),
+        upload_kbps_mean=_mean(_values(datasets.speed_results, "upload_kbps")),
+        rssi_avg_mean=rssi,
+        high_latency=latency is not None and latency.p95 >= _HIGH_LATENCY_US,
+        high_jitter=jitter is not None and jitter.p95 >= _HIGH_JITTER_US,
+        high_packet_loss=(_mean(packet_loss) or 0.0) >= _HIGH_PACKET_LOSS_PCT,
+        wifi_weak=rssi is not None and rssi < _WEAK_WIFI_RSSI_DBM,
+        unavailable=[name for name, value in datasets if isinstance(value, dict)],
+    )
+
+
+@mcp.tool(
+    annotations={
+        "title": "Get Network Summary",
+        "readOnlyHint": True,
+        "idempotentHint": False,
+        "openWorldHint": True,
+    }
+)
+async def get_summary(
+    host: Optional[str] = None,
+    granularity: Literal["1s", "15s", "1m"] = "1s",
+    port: Optional[int] = None,
+    caller_id: Optional[str] = None,
+    timeout: Optional[float] = None,
+    since: Optional[int] = None,
+) -> NetworkSummary:
+    """
+    Summarize network quality from an Orb sensor in a few statistics.
+
+    Fetches all datasets and computes the summary on the server, so it is much
+    smaller than the raw records. Start here, and only call the dataset tools to
+    drill into a problem the summary reveals.
+
+    IMPORTANT: If the responsiveness or Wi-Fi link dataset is listed in
+    unavailable, that granularity may not be enabled on this sensor. Try the
+    other granularities (1s → 15s → 1m).
+
+    Note on Stateful Polling:
+        By default, this tool uses its own session-specific caller_id, so it
+        doesn't consume records the dataset tools would return. The first call
+        summarizes data collected since the server started (or, if ORB_CALLER_ID
+        is set, everything the sensor has not yet returned to it), and
+        subsequent calls summarize only new data collected since the last call.
+
+    Args:
+        granularity: Responsiveness and Wi-Fi link bucket size - '1s', '15s', or
+                     '1m' (default: '1s')
+        host: Orb sensor hostname or IP (default: from ORB_HOST env var or 'localhost')
+        port: API port number (default: from ORB_PORT env var or 7080)
+        caller_id: Unique ID to track polling state. Leave as None to use the default
+                   session-specific ID, or provide your own for custom polling behavior.
+        timeout: Request timeout in seconds (default: 30.0)
+        since: Only summarize records with a timestamp at or after this time, in
+               epoch milliseconds (default: when the server started, or no
+               filter if ORB_CALLER_ID is set). Pass 0 for the sensor's full
+               history.
+
+    Returns:
+        - orb_score_mean: Mean Orb Score (0-100)
+        - latency_us, jitter_us, packet_loss_pct: p50, p95, and p99 of each
+          responsiveness measure
+        - download_kbps_mean, upload_kbps_mean: Mean speed test results
+        - rssi_avg_mean: Mean Wi-Fi signal strength in dBm
+        - high_latency, high_jitter, high_packet_loss, wifi_weak: Problem flags
+        - unavailable: Datasets that could not be fetched
+
+        Statistics are None when there are no records for them.
+
+    **Example Usage:**
+        "How's my network?"
+        "Is anything wrong with my internet right now?"
+    """
+    client = get_client(host, port, caller_id or f"{config.caller_id}-summary", timeout)
+    logger.debug("Getting network summary from Orb sensor %s", client.host)
+    datasets = await _fetch(
+        client,
+        ("summary", granularity),
+        functools.partial(client.get_all_datasets, default_granularity=granularity),
+    )
+    return _summarize(_trim_all(datasets, since, None), granularity)
 
 
 def _get_client_info_impl(
@@ -602,41 +1053,35 @@ def get_client_info(
     return _get_client_info_impl(host, port, caller_id, timeout)
 
 
-@mcp.prompt()
-def analyze_network_quality() -> str:
-    """Analyze current network quality for the configured Orb and provide insights"""
-    return """
+# Prompt text, dedented once at import so no indentation is sent to the model
+_ANALYZE_NETWORK_QUALITY_PROMPT = inspect.cleandoc("""
     Analyze the network quality using these steps:
-    1. Call get_scores_1m() to get the latest Orb scores
-    2. Examine orb_score (0-100, higher is better)
-    3. Check component scores: responsiveness_score, reliability_score, speed_score
-    4. If scores are low, call get_responsiveness() for detailed metrics
+    1. Call get_summary() for an overview and problem flags
+    2. Examine orb_score_mean (0-100, higher is better)
+    3. If the score is low or a flag is set, call get_scores_1m() to check the
+       component scores: responsiveness_score, reliability_score, speed_score
+    4. Call get_responsiveness() only if you need detailed metrics
     5. Provide actionable insights about network performance
-    """
-
+    """)
 
-@mcp.prompt()
-def troubleshoot_slow_internet() -> str:
-    """Diagnose slow internet connection issues"""
-    return """
+_TROUBLESHOOT_SLOW_INTERNET_PROMPT = inspect.cleandoc("""
     To troubleshoot slow internet:
-    1. Call get_speed_results() to check recent speed tests
-    2. Call get_responsiveness() for latency/jitter data
-    3. Call get_web_responsiveness() to check TTFB and DNS performance
-    4. Compare metrics against typical values:
+    1. Call get_summary() for speed, latency, jitter, and packet loss statistics
+    2. Compare metrics against typical values (high_latency, high_jitter, and
+       high_packet_loss flag values outside these):
        - Good latency: < 50ms
        - Good jitter: < 10ms
        - Acceptable packet loss: < 1%
+    3. Call get_speed_results() or get_responsiveness() only to drill into a
+       problematic metric
+    4. Call get_web_responsiveness() to check TTFB and DNS performance
     5. Identify which metric is problematic and explain to the user
-    """
-
+    """)
 
-@mcp.prompt()
-def troubleshoot_wifi() -> str:
-    """Diagnose Wi-Fi-specific issues by correlating signal metrics with performance"""
-    return """
+_TROUBLESHOOT_WIFI_PROMPT = inspect.cleandoc("""
     To diagnose Wi-Fi-specific network issues:
-    1. Call get_wifi_link() to get signal and link metrics
+    1. Call get_summary() and check rssi_avg_mean and wifi_weak, then call
+       get_wifi_link() to get detailed signal and link metrics
     2. Examine key signal indicators:
        - rssi_avg: Signal strength in dBm (good: > -65, poor: < -75)
        - snr_avg: Signal-to-noise ratio in dB (good: > 25, poor: < 15)
@@ -660,12 +1105,35 @@ def troubleshoot_wifi() -> str:
        Some fields are platform-specific (rx_rate_mbps unavailable on macOS;
        security and channel_width unavailable on Android; mcs and nss Linux only).
     8. Summarize with specific, actionable recommendations.
-    """
+    """)
+
+
+@mcp.prompt()
+def analyze_network_quality() -> str:
+    """Analyze current network quality for the configured Orb and provide insights"""
+    return _ANALYZE_NETWORK_QUALITY_PROMPT
+
+
+@mcp.prompt()
+def troubleshoot_slow_internet() -> str:
+    """Diagnose slow internet connection issues"""
+    return _TROUBLESHOOT_SLOW_INTERNET_PROMPT
+
+
+@mcp.prompt()
+def troubleshoot_wifi() -> str:
+    """Diagnose Wi-Fi-specific issues by correlating signal metrics with performance"""
+    return _TROUBLESHOOT_WIFI_PROMPT
 
 
 def main() -> None:
     """Entry point for running the MCP server."""
-    mcp.run()
+    if importlib.util.find_spec("uvloop") is None:
+        mcp.run()
+    else:
+        # uvloop (installed with the mcp extra, except on Windows) is a faster
+        # drop-in replacement for the default asyncio event loop
+        anyio.run(mcp.run_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":
@@ -21,13 +21,18 @@ class OrbClientConfig(BaseModel):
     )
     caller_id: Optional[str] = Field(
         default=None,
-        description="Unique ID for this caller to track polling state. If None, generates a random UUID.",  # noqa: E501
+        description="Unique ID for this caller to track polling state. If None, generates a random ID.",  # noqa: E501
     )
     client_id: Optional[str] = Field(
         default=None,
         description="Optional identifier for the HTTP client itself (sent as User-Agent header). If None, uses a default.",  # noqa: E501
     )
     timeout: float = Field(default=30.0, gt=0, description="Request timeout in seconds")
+    max_retries: int = Field(
+        default=3,
+        ge=0,
+        description="Times to retry a request that was rate limited, hit an unavailable server, or could not connect",  # noqa: E501
+    )
 
     model_config = ConfigDict(validate_assignment=True)
 
@@ -373,7 +378,9 @@ class WifiLinkDimensions(NetworkDimensions):
 class BaseRecord(BaseModel):
     """Base record with common configuration"""
 
-    model_config = ConfigDict(extra="allow")
+    # Build each record's validator on first use rather than at import, so
+    # callers only pay for the datasets they fetch
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class ScoreRecord(BaseRecord, ScoreIdentifiers, ScoreMeasures, ScoreDimensions):
@@ -469,4 +476,4 @@ class AllDatasetsResponse(BaseModel):
     wifi_link_15s: Optional[List[WifiLinkRecord] | dict] = None
     wifi_link_1s: Optional[List[WifiLinkRecord] | dict] = None
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
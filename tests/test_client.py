@@ -2,12 +2,18 @@
 Tests for OrbAPIClient in orbnet.client.
 """
 
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from orbnet.client import OrbAPIClient
+from orbnet.client import OrbAPIClient, _retry_delay, _run_in_thread
 from orbnet.models import (
     AllDatasetsResponse,
     ResponsivenessRecord,
@@ -26,7 +32,8 @@ class TestOrbAPIClient:
         client = OrbAPIClient(host="192.168.1.100")
         assert client.host == "192.168.1.100"
         assert client.port == 7080
-        assert client.caller_id is not None  # Should generate UUID
+        assert len(client.caller_id) == 24  # Random hex ID
+        assert client.caller_id != OrbAPIClient(host="192.168.1.100").caller_id
         assert client.client_id.startswith("orbnet/")
         assert client.timeout == 30.0
 
@@ -50,6 +57,13 @@ class TestOrbAPIClient:
         client = OrbAPIClient(host="example.com", port=9000)
         assert client.base_url == "http://example.com:9000"
 
+    def test_no_instance_dict(self):
+        """Test that OrbAPIClient stores its state in slots."""
+        client = OrbAPIClient(host="192.168.1.100")
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
+
     def test_get_headers(self):
         """Test _get_headers method."""
         client = OrbAPIClient(host="192.168.1.100", client_id="test-client")
@@ -59,20 +73,114 @@ class TestOrbAPIClient:
             "User-Agent": "test-client",
         }
 
+    @pytest.mark.asyncio
+    async def test_http_client_configuration(self):
+        """Test that the pooled HTTP client uses the configured base URL."""
+        client = OrbAPIClient(host="example.com", port=9000, client_id="test-client")
+        http_client = client._get_client()
+        assert http_client.base_url == "http://example.com:9000"
+        assert http_client.headers["User-Agent"] == "test-client"
+        assert http_client.timeout.read == 30.0
+        assert http_client.timeout.connect == 10.0
+        assert client._get_sync_client().timeout == http_client.timeout
+        assert (
+            OrbAPIClient(host="example.com", timeout=5.0)._get_timeout().connect == 5.0
+        )
+        assert "gzip" in http_client.headers["Accept-Encoding"]
+        assert client._get_client() is http_client
+
+    def test_http_client_per_event_loop(self):
+        """Test that a client can be used from successive asyncio.run() calls."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"[]")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = OrbAPIClient(host="127.0.0.1", port=server.server_address[1])
+            assert asyncio.run(client.get_scores_1m()) == []
+            assert asyncio.run(client.get_scores_1m()) == []
+            # The pool from the closed loop is dropped rather than closed
+            asyncio.run(client.aclose())
+            assert client._client is None
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_http_client_created_lazily(self):
+        """Test that constructing a client does not open a connection pool."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            OrbAPIClient(host="192.168.1.100")
+            mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reuses_http_client(self, sample_scores_data, mock_httpx_response):
+        """Test that consecutive requests share one HTTP client."""
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            await client._get_dataset("scores_1m")
+            await client._get_dataset("speed_results")
+
+            mock_client_class.assert_called_once()
+            assert mock_client.get.call_count == 2
+
+            # Requests without overrides share the precomputed query params
+            first, second = mock_client.get.call_args_list
+            assert first.kwargs["params"] is second.kwargs["params"]
+            assert first.kwargs["params"] == httpx.QueryParams(id=client.caller_id)
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self):
+        """Test that leaving `async with` closes the HTTP client."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            async with OrbAPIClient(host="192.168.1.100") as client:
+                assert isinstance(client, OrbAPIClient)
+                client._get_client()
+
+            mock_client.aclose.assert_awaited_once()
+            assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_unused_client(self):
+        """Test that closing a client that never made a request is a no-op."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            client = OrbAPIClient(host="192.168.1.100")
+            await client.aclose()
+            mock_client_class.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_dataset(self, sample_scores_data, mock_httpx_response):
         """Test _get_dataset method."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
             result = await client._get_dataset("scores_1m")
 
-            assert result == sample_scores_data
+            assert json.loads(result) == sample_scores_data
             mock_client.get.assert_called_once()
             call_args = mock_client.get.call_args
             assert "scores_1m.json" in call_args[0][0]
@@ -83,17 +191,17 @@ class TestOrbAPIClient:
         self, sample_scores_data, mock_httpx_response
     ):
         """Test _get_dataset with custom caller_id."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
             result = await client._get_dataset("scores_1m", caller_id="custom-caller")
 
-            assert result == sample_scores_data
+            assert json.loads(result) == sample_scores_data
             call_args = mock_client.get.call_args
             assert call_args[1]["params"]["id"] == "custom-caller"
 
@@ -102,11 +210,11 @@ class TestOrbAPIClient:
         self, sample_scores_data, mock_httpx_response
     ):
         """Test _get_dataset with extra parameters."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -116,12 +224,29 @@ class TestOrbAPIClient:
                 end_time=1700000060000,
             )
 
-            assert result == sample_scores_data
+            assert json.loads(result) == sample_scores_data
             call_args = mock_client.get.call_args
             params = call_args[1]["params"]
             assert params["start_time"] == 1700000000000
             assert params["end_time"] == 1700000060000
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("dataset_name", ["wifi_link_15s", "new_dataset_1m"])
+    async def test_get_dataset_path(self, dataset_name, mock_httpx_response):
+        """Test _get_dataset builds the path for known and other datasets."""
+        mock_httpx_response.content = b"[]"
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            await client._get_dataset(dataset_name)
+
+            path = mock_client.get.call_args[0][0]
+            assert path == f"/api/v2/datasets/{dataset_name}.json"
+
     @pytest.mark.asyncio
     async def test_get_dataset_http_error(self, mock_httpx_response):
         """Test _get_dataset with HTTP error."""
@@ -131,7 +256,7 @@ class TestOrbAPIClient:
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -139,14 +264,170 @@ class TestOrbAPIClient:
             with pytest.raises(httpx.HTTPStatusError):
                 await client._get_dataset("scores_1m")
 
+            assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_retries_unavailable(self):
+        """Test _get_dataset waits for Retry-After and retries a 503."""
+        request = httpx.Request("GET", "http://192.168.1.100:7080")
+        unavailable = httpx.Response(503, headers={"Retry-After": "2"}, request=request)
+        ok = httpx.Response(200, content=b"[]", request=request)
+
+        with (
+            patch("httpx.AsyncClient") as mock_client_class,
+            patch("orbnet.client.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.side_effect = [unavailable, ok]
+
+            client = OrbAPIClient(host="192.168.1.100")
+            assert await client._get_dataset("scores_1m") == b"[]"
+
+            assert mock_client.get.call_count == 2
+            sleep.assert_awaited_once()
+            assert sleep.call_args.args[0] == pytest.approx(2, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_retry_limit(self):
+        """Test _get_dataset raises once max_retries is used up."""
+        request = httpx.Request("GET", "http://192.168.1.100:7080")
+        limited = httpx.Response(429, request=request)
+
+        with (
+            patch("httpx.AsyncClient") as mock_client_class,
+            patch("orbnet.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = limited
+
+            client = OrbAPIClient(host="192.168.1.100", max_retries=2)
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._get_dataset("scores_1m")
+
+            assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_dataset_retries_connect_error(self, mock_httpx_response):
+        """Test _get_dataset backs off and retries when it cannot connect."""
+        mock_httpx_response.content = b"[]"
+
+        with (
+            patch("httpx.AsyncClient") as mock_client_class,
+            patch("orbnet.client.asyncio.sleep", new_callable=AsyncMock) as sleep,
+        ):
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.side_effect = [
+                httpx.ConnectError("Connection refused"),
+                mock_httpx_response,
+            ]
+
+            client = OrbAPIClient(host="192.168.1.100")
+            assert await client._get_dataset("scores_1m") == b"[]"
+            assert 0 < sleep.call_args.args[0] <= 1.0
+
+            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+            client.config.max_retries = 0
+            with pytest.raises(httpx.ConnectError):
+                await client._get_dataset("scores_1m")
+
+    @pytest.mark.parametrize(
+        "retry_after,expected",
+        [
+            ("5", 5.0),
+            ("-1", 0.0),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            ("Wed, 21 Oct 2015 07:28:00 -0000", 0.0),
+            ("86400", 30.0),
+            ("Fri, 31 Dec 9999 23:59:59 GMT", 30.0),
+            ("Fri, 31 Dec 9999 23:59:59 -0000", 30.0),
+        ],
+    )
+    def test_retry_delay_from_header(self, retry_after, expected):
+        """Test Retry-After is read as seconds or as an HTTP date, capped."""
+        response = httpx.Response(503, headers={"Retry-After": retry_after})
+        assert _retry_delay(0, response) == expected
+
+    def test_retry_delay_backoff(self):
+        """Test retries without a usable Retry-After back off exponentially."""
+        response = httpx.Response(503, headers={"Retry-After": "soon"})
+        assert 0.5 <= _retry_delay(0, response) <= 1.0
+        assert 4.0 <= _retry_delay(3) <= 4.5
+        assert _retry_delay(20) <= 30.5
+
+    @pytest.mark.asyncio
+    async def test_stream_dataset_splits_lines(
+        self, sample_scores_data, mock_httpx_response
+    ):
+        """Test stream_dataset parses records split across response chunks."""
+        body = "\r\n\n".join(json.dumps(r) for r in sample_scores_data).encode()
+
+        async def aiter_bytes():
+            # Chunk boundaries fall inside records; the last line has no newline
+            for start in range(0, len(body), 7):
+                yield body[start : start + 7]
+
+        mock_httpx_response.aiter_bytes = aiter_bytes
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.stream.return_value.__aenter__.return_value = (
+                mock_httpx_response
+            )
+
+            client = OrbAPIClient(host="192.168.1.100")
+            records = [
+                r async for r in client.stream_dataset("scores_1m", start_time=1)
+            ]
+
+            assert records == [ScoreRecord(**r) for r in sample_scores_data]
+            method, path = mock_client.stream.call_args.args
+            assert (method, path) == ("GET", "/api/v2/datasets/scores_1m.jsonl")
+            params = mock_client.stream.call_args.kwargs["params"]
+            assert params == {"id": client.caller_id, "start_time": 1}
+            mock_httpx_response.raise_for_status.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("validate", [True, False])
+    async def test_stream_dataset(self, validate, sample_speed_data):
+        """Test stream_dataset yields model records from JSON Lines."""
+        body = "\n".join(json.dumps(r) for r in sample_speed_data).encode()
+
+        async def aiter_bytes():
+            yield body
+
+        response = MagicMock()
+        response.aiter_bytes = aiter_bytes
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.stream.return_value.__aenter__.return_value = response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            records = [
+                r
+                async for r in client.stream_dataset("speed_results", validate=validate)
+            ]
+
+            assert len(records) == len(sample_speed_data)
+            assert all(isinstance(r, SpeedRecord) for r in records)
+            assert records[0].download_kbps == sample_speed_data[0]["download_kbps"]
+
+            with pytest.raises(ValueError, match="Unknown dataset"):
+                await anext(client.stream_dataset("not_a_dataset"))
+
     @pytest.mark.asyncio
     async def test_get_scores_1m(self, sample_scores_data, mock_httpx_response):
         """Test get_scores_1m method returns ScoreRecord objects."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -165,17 +446,38 @@ class TestOrbAPIClient:
             call_args = mock_client.get.call_args
             assert "scores_1m.json" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_get_scores_1m_without_validation(
+        self, sample_scores_data, mock_httpx_response
+    ):
+        """Test get_scores_1m with validate=False skips type coercion."""
+        sample_scores_data[0]["orb_score"] = "85.5"
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            result = await client.get_scores_1m(validate=False)
+
+            assert all(isinstance(r, ScoreRecord) for r in result)
+            assert result[0].orb_id == sample_scores_data[0]["orb_id"]
+            # Unvalidated records keep values exactly as the sensor sent them
+            assert result[0].orb_score == "85.5"
+
     @pytest.mark.asyncio
     async def test_get_responsiveness_1m(
         self, sample_responsiveness_data, mock_httpx_response
     ):
         """Test get_responsiveness method with 1m granularity returns
         ResponsivenessRecord objects."""
-        mock_httpx_response.json.return_value = sample_responsiveness_data
+        mock_httpx_response.content = json.dumps(sample_responsiveness_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -202,11 +504,11 @@ class TestOrbAPIClient:
         self, sample_responsiveness_data, mock_httpx_response
     ):
         """Test get_responsiveness method with 1s granularity."""
-        mock_httpx_response.json.return_value = sample_responsiveness_data
+        mock_httpx_response.content = json.dumps(sample_responsiveness_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -222,11 +524,11 @@ class TestOrbAPIClient:
         self, sample_responsiveness_data, mock_httpx_response
     ):
         """Test get_responsiveness method with 15s granularity."""
-        mock_httpx_response.json.return_value = sample_responsiveness_data
+        mock_httpx_response.content = json.dumps(sample_responsiveness_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -243,11 +545,13 @@ class TestOrbAPIClient:
     ):
         """Test get_web_responsiveness method returns WebResponsivenessRecord
         objects."""
-        mock_httpx_response.json.return_value = sample_web_responsiveness_data
+        mock_httpx_response.content = json.dumps(
+            sample_web_responsiveness_data
+        ).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -269,11 +573,11 @@ class TestOrbAPIClient:
     @pytest.mark.asyncio
     async def test_get_speed_results(self, sample_speed_data, mock_httpx_response):
         """Test get_speed_results method returns SpeedRecord objects."""
-        mock_httpx_response.json.return_value = sample_speed_data
+        mock_httpx_response.content = json.dumps(sample_speed_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -297,11 +601,11 @@ class TestOrbAPIClient:
     @pytest.mark.asyncio
     async def test_get_wifi_link_1m(self, sample_wifi_link_data, mock_httpx_response):
         """Test get_wifi_link with 1m granularity returns WifiLinkRecord objects."""
-        mock_httpx_response.json.return_value = sample_wifi_link_data
+        mock_httpx_response.content = json.dumps(sample_wifi_link_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -321,11 +625,11 @@ class TestOrbAPIClient:
     @pytest.mark.asyncio
     async def test_get_wifi_link_1s(self, sample_wifi_link_data, mock_httpx_response):
         """Test get_wifi_link method with 1s granularity."""
-        mock_httpx_response.json.return_value = sample_wifi_link_data
+        mock_httpx_response.content = json.dumps(sample_wifi_link_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -339,11 +643,11 @@ class TestOrbAPIClient:
     @pytest.mark.asyncio
     async def test_get_wifi_link_15s(self, sample_wifi_link_data, mock_httpx_response):
         """Test get_wifi_link method with 15s granularity."""
-        mock_httpx_response.json.return_value = sample_wifi_link_data
+        mock_httpx_response.content = json.dumps(sample_wifi_link_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -354,6 +658,144 @@ class TestOrbAPIClient:
             call_args = mock_client.get.call_args
             assert "wifi_link_15s.json" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_get_dataset_raw(self, sample_speed_data, mock_httpx_response):
+        """Test get_dataset_raw returns the response body unparsed."""
+        body = json.dumps(sample_speed_data).encode()
+        mock_httpx_response.content = body
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            assert await client.get_dataset_raw("speed_results") is body
+
+            with pytest.raises(ValueError, match="Unknown dataset"):
+                await client.get_dataset_raw("not_a_dataset")
+            assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["get_responsiveness", "get_wifi_link"])
+    async def test_invalid_granularity(self, method):
+        """Test that unsupported granularities are rejected before any request."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            client = OrbAPIClient(host="192.168.1.100")
+
+            with pytest.raises(ValueError, match="Invalid granularity"):
+                await getattr(client, method)(granularity="5m")
+            mock_client.get.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method,args,path,fixture,model",
+        [
+            ("get_scores_1m_sync", (), "scores_1m", "sample_scores_data", ScoreRecord),
+            (
+                "get_responsiveness_sync",
+                ("15s",),
+                "responsiveness_15s",
+                "sample_responsiveness_data",
+                ResponsivenessRecord,
+            ),
+            (
+                "get_web_responsiveness_sync",
+                (),
+                "web_responsiveness_results",
+                "sample_web_responsiveness_data",
+                WebResponsivenessRecord,
+            ),
+            (
+                "get_speed_results_sync",
+                (),
+                "speed_results",
+                "sample_speed_data",
+                SpeedRecord,
+            ),
+            (
+                "get_wifi_link_sync",
+                ("1s",),
+                "wifi_link_1s",
+                "sample_wifi_link_data",
+                WifiLinkRecord,
+            ),
+        ],
+    )
+    def test_sync_getters(
+        self, method, args, path, fixture, model, mock_httpx_response, request
+    ):
+        """Test the synchronous getters fetch and parse each dataset."""
+        data = request.getfixturevalue(fixture)
+        mock_httpx_response.content = json.dumps(data).encode()
+
+        with patch("httpx.Client") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            with OrbAPIClient(host="192.168.1.100") as client:
+                result = getattr(client, method)(*args)
+                unvalidated = getattr(client, method)(*args, validate=False)
+
+            assert len(result) == len(data)
+            assert all(isinstance(r, model) for r in result + unvalidated)
+            endpoint = mock_client.get.call_args.args[0]
+            assert endpoint == f"/api/v2/datasets/{path}.json"
+            mock_client.close.assert_called_once()
+            assert client._sync_client is None
+
+    @pytest.mark.parametrize(
+        "method", ["get_responsiveness_sync", "get_wifi_link_sync"]
+    )
+    def test_sync_invalid_granularity(self, method):
+        """Test the synchronous getters reject unsupported granularities."""
+        with patch("httpx.Client") as mock_client_class:
+            client = OrbAPIClient(host="192.168.1.100")
+            with pytest.raises(ValueError, match="Invalid granularity"):
+                getattr(client, method)(granularity="5m")
+            mock_client_class.assert_not_called()
+
+    def test_get_dataset_sync_retries(self):
+        """Test _get_dataset_sync retries like _get_dataset."""
+        request = httpx.Request("GET", "http://192.168.1.100:7080")
+        unavailable = httpx.Response(503, headers={"Retry-After": "2"}, request=request)
+        ok = httpx.Response(200, content=b"[]", request=request)
+
+        with (
+            patch("httpx.Client") as mock_client_class,
+            patch("orbnet.client.time.sleep") as sleep,
+        ):
+            mock_client = MagicMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.side_effect = [
+                httpx.ConnectError("Connection refused"),
+                unavailable,
+                ok,
+            ]
+
+            client = OrbAPIClient(host="192.168.1.100")
+            assert client._get_dataset_sync("scores_1m") == b"[]"
+            assert sleep.call_count == 2
+            assert sleep.call_args.args[0] == 2.0
+
+            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
+            client.config.max_retries = 0
+            with pytest.raises(httpx.ConnectError):
+                client._get_dataset_sync("scores_1m")
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_sync_client(self):
+        """Test that aclose also closes the synchronous connection pool."""
+        with patch("httpx.Client") as mock_client_class:
+            client = OrbAPIClient(host="192.168.1.100")
+            client._get_sync_client()
+            await client.aclose()
+
+            mock_client_class.return_value.close.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_all_datasets_basic(
         self,
@@ -571,14 +1013,222 @@ class TestOrbAPIClient:
             assert isinstance(result.web_responsiveness, list)
             assert isinstance(result.speed_results, list)
 
+    @pytest.mark.asyncio
+    async def test_get_all_datasets_shares_http_client(self, mock_httpx_response):
+        """Test get_all_datasets issues every sub-request on one pooled client."""
+        mock_httpx_response.content = b"[]"
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+            mock_client.get.return_value = mock_httpx_response
+
+            client = OrbAPIClient(host="192.168.1.100")
+            await client.get_all_datasets(
+                include_all_responsiveness=True, include_all_wifi_link=True
+            )
+
+            mock_client_class.assert_called_once()
+            assert mock_client.get.await_count == 9
+
+    @pytest.mark.asyncio
+    async def test_get_all_datasets_reuses_records(self, sample_speed_data):
+        """Test get_all_datasets returns the getters' lists without copying."""
+        speed = [SpeedRecord(**r) for r in sample_speed_data]
+        names = [
+            "get_scores_1m",
+            "get_responsiveness",
+            "get_web_responsiveness",
+            "get_wifi_link",
+        ]
+        with (
+            patch.multiple(
+                OrbAPIClient, **{n: AsyncMock(return_value=[]) for n in names}
+            ),
+            patch.object(OrbAPIClient, "get_speed_results", return_value=speed),
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            result = await client.get_all_datasets()
+
+            assert result.speed_results is speed
+            assert result.responsiveness_15s is None
+            assert result.model_fields_set == {
+                "scores_1m",
+                "responsiveness_1m",
+                "web_responsiveness",
+                "speed_results",
+                "wifi_link_1m",
+            }
+
+    @pytest.mark.asyncio
+    async def test_iter_all_datasets(self):
+        """Test iter_all_datasets yields each dataset in completion order."""
+
+        async def slow_speed_results(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return []
+
+        with (
+            patch.multiple(
+                OrbAPIClient,
+                get_scores_1m=AsyncMock(return_value=[]),
+                get_responsiveness=AsyncMock(side_effect=Exception("Timed out")),
+                get_web_responsiveness=AsyncMock(return_value=[]),
+                get_wifi_link=AsyncMock(return_value=[]),
+            ),
+            patch.object(OrbAPIClient, "get_speed_results", slow_speed_results),
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            results = [item async for item in client.iter_all_datasets()]
+
+        assert len(results) == 5
+        assert results[-1] == ("speed_results", [])
+        assert ("responsiveness_1m", {"error": "Timed out"}) in results
+
+    @pytest.mark.asyncio
+    async def test_iter_all_datasets_cancels_on_early_exit(self):
+        """Test stopping iteration early cancels fetches still in flight."""
+        cancelled = asyncio.Event()
+
+        async def never_finishes(*args, **kwargs):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with (
+            patch.multiple(
+                OrbAPIClient,
+                get_scores_1m=AsyncMock(return_value=[]),
+                get_responsiveness=never_finishes,
+                get_web_responsiveness=never_finishes,
+                get_speed_results=never_finishes,
+                get_wifi_link=never_finishes,
+            ),
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            datasets = client.iter_all_datasets()
+            assert await anext(datasets) == ("scores_1m", [])
+            await datasets.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_get_all_datasets_max_concurrency(self):
+        """Test max_concurrency caps the number of fetches in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def tracked_fetch(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with patch.multiple(
+            OrbAPIClient,
+            get_scores_1m=tracked_fetch,
+            get_responsiveness=tracked_fetch,
+            get_web_responsiveness=tracked_fetch,
+            get_speed_results=tracked_fetch,
+            get_wifi_link=tracked_fetch,
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            result = await client.get_all_datasets(
+                include_all_responsiveness=True, max_concurrency=2
+            )
+            assert peak == 2
+            assert result.responsiveness_1s == []
+
+            peak = 0
+            items = [item async for item in client.iter_all_datasets(max_concurrency=1)]
+            assert peak == 1
+            assert len(items) == 5
+
+    @pytest.mark.asyncio
+    async def test_iter_datasets(self):
+        """Test iter_datasets fetches the named datasets with shared options."""
+        with patch.multiple(
+            OrbAPIClient,
+            get_wifi_link=AsyncMock(return_value=[]),
+            get_speed_results=AsyncMock(side_effect=Exception("Timed out")),
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            results = dict(
+                [
+                    item
+                    async for item in client.iter_datasets(
+                        ["wifi_link_1s", "wifi_link_15s", "speed_results"],
+                        caller_id="batch",
+                        validate=False,
+                        max_concurrency=2,
+                    )
+                ]
+            )
+
+            assert results == {
+                "wifi_link_1s": [],
+                "wifi_link_15s": [],
+                "speed_results": {"error": "Timed out"},
+            }
+            first_call = OrbAPIClient.get_wifi_link.call_args_list[0]
+            assert first_call.args == ("1s",)
+            assert first_call.kwargs == {"caller_id": "batch", "validate": False}
+
+    @pytest.mark.asyncio
+    async def test_iter_datasets_unknown_name(self):
+        """Test iter_datasets rejects unknown names before fetching anything."""
+        with patch.object(OrbAPIClient, "get_scores_1m", AsyncMock()) as mock_get:
+            client = OrbAPIClient(host="192.168.1.100")
+            with pytest.raises(ValueError, match="Unknown dataset: bogus"):
+                async for _ in client.iter_datasets(["scores_1m", "bogus"]):
+                    pass
+            mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_datasets_without_validation(self):
+        """Test get_all_datasets passes validate=False to every getter."""
+        names = [
+            "get_scores_1m",
+            "get_responsiveness",
+            "get_web_responsiveness",
+            "get_speed_results",
+            "get_wifi_link",
+        ]
+        with patch.multiple(
+            OrbAPIClient, **{n: AsyncMock(return_value=[]) for n in names}
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            await client.get_all_datasets(validate=False)
+
+            for name in names:
+                assert getattr(OrbAPIClient, name).call_args.args[-1] is False
+
+    @pytest.mark.asyncio
+    async def test_poll_dataset_without_validation(self):
+        """Test poll_dataset passes validate=False to the fetch method."""
+        with patch.object(
+            OrbAPIClient, "get_speed_results", AsyncMock(return_value=[])
+        ) as mock_get:
+            client = OrbAPIClient(host="192.168.1.100")
+            async for _ in client.poll_dataset(
+                "speed_results", interval=0.01, max_iterations=1, validate=False
+            ):
+                pass
+
+            mock_get.assert_awaited_once_with(validate=False)
+
     @pytest.mark.asyncio
     async def test_poll_dataset_success(self, sample_scores_data, mock_httpx_response):
         """Test poll_dataset method with successful polling returns Pydantic objects."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -600,7 +1250,7 @@ class TestOrbAPIClient:
         self, sample_scores_data, mock_httpx_response
     ):
         """Test poll_dataset method with callback function."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
         callback_calls = []
 
         def test_callback(dataset_name, records):
@@ -608,7 +1258,7 @@ class TestOrbAPIClient:
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -626,12 +1276,45 @@ class TestOrbAPIClient:
             # Check callback received Pydantic objects
             assert all(isinstance(r, ScoreRecord) for r in callback_calls[0][1])
 
+    @pytest.mark.asyncio
+    async def test_poll_dataset_offload_sync_callback(self):
+        """Test offloaded sync callbacks run in a thread with the caller's context."""
+        request_id = contextvars.ContextVar("request_id")
+        request_id.set("abc")
+        callback_calls = []
+
+        def test_callback(dataset_name, records):
+            callback_calls.append((threading.get_ident(), request_id.get(None)))
+
+        with patch.object(
+            OrbAPIClient, "get_scores_1m", AsyncMock(return_value=[MagicMock()])
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            async for _ in client.poll_dataset(
+                "scores_1m",
+                max_iterations=1,
+                callback=test_callback,
+                offload_sync_callback=True,
+            ):
+                pass
+
+        assert callback_calls == [(callback_calls[0][0], "abc")]
+        assert callback_calls[0][0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_run_in_thread_empty_context(self):
+        """Test _run_in_thread calls the function directly with no context vars."""
+        task = asyncio.get_running_loop().create_task(
+            _run_in_thread(threading.get_ident), context=contextvars.Context()
+        )
+        assert await task != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_poll_dataset_with_async_callback(
         self, sample_scores_data, mock_httpx_response
     ):
         """Test poll_dataset method with async callback function."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
         callback_calls = []
 
         async def test_async_callback(dataset_name, records):
@@ -639,7 +1322,7 @@ class TestOrbAPIClient:
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -673,7 +1356,7 @@ class TestOrbAPIClient:
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -693,6 +1376,60 @@ class TestOrbAPIClient:
             assert caplog.records[0].levelno == logging.WARNING
             assert "scores_1m" in caplog.records[0].message
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("dataset_name", "method", "args"),
+        [
+            ("responsiveness_1s", "get_responsiveness", ("1s",)),
+            ("web_responsiveness_results", "get_web_responsiveness", ()),
+            ("wifi_link_15s", "get_wifi_link", ("15s",)),
+        ],
+    )
+    async def test_poll_dataset_dispatch(self, dataset_name, method, args):
+        """Test poll_dataset fetches each dataset with the matching getter."""
+        with patch.object(OrbAPIClient, method, AsyncMock(return_value=[])) as mock:
+            client = OrbAPIClient(host="192.168.1.100")
+            async for _ in client.poll_dataset(dataset_name, max_iterations=1):
+                pass
+
+            mock.assert_awaited_once_with(*args, validate=True)
+
+    @pytest.mark.asyncio
+    async def test_poll_dataset_no_sleep_after_last_poll(self):
+        """Test poll_dataset only sleeps between polls, not after the last one."""
+        with (
+            patch.object(OrbAPIClient, "get_scores_1m", AsyncMock(return_value=[])),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            async for _ in client.poll_dataset(
+                "scores_1m", interval=60.0, max_iterations=3
+            ):
+                pass
+
+            assert mock_sleep.await_count == 2
+            assert 59.0 < mock_sleep.await_args_list[0].args[0] <= 60.0
+
+    @pytest.mark.asyncio
+    async def test_poll_dataset_skips_sleep_when_behind(self):
+        """Test poll_dataset polls again immediately when a fetch overruns."""
+
+        async def slow_fetch(*args, **kwargs):
+            time.sleep(0.02)  # Longer than the polling interval
+            return []
+
+        with (
+            patch.object(OrbAPIClient, "get_scores_1m", slow_fetch),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            client = OrbAPIClient(host="192.168.1.100")
+            async for _ in client.poll_dataset(
+                "scores_1m", interval=0.01, max_iterations=3
+            ):
+                pass
+
+            mock_sleep.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_poll_dataset_invalid_dataset_name(self):
         """Test poll_dataset method with invalid dataset name."""
@@ -707,11 +1444,11 @@ class TestOrbAPIClient:
     @pytest.mark.asyncio
     async def test_poll_dataset_infinite(self, sample_scores_data, mock_httpx_response):
         """Test poll_dataset method with infinite polling (max_iterations=None)."""
-        mock_httpx_response.json.return_value = sample_scores_data
+        mock_httpx_response.content = json.dumps(sample_scores_data).encode()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
             mock_client.get.return_value = mock_httpx_response
 
             client = OrbAPIClient(host="192.168.1.100")
@@ -5,11 +5,26 @@ prompts via their ``.fn`` attribute, patching ``get_client`` so no real
 network calls are made.
 """
 
+import asyncio
+import os
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+from fastmcp.exceptions import ToolError
+from pydantic import ValidationError
 
 from orbnet import mcp_server
+from orbnet.client import OrbAPIClient
+from orbnet.models import (
+    AllDatasetsResponse,
+    ResponsivenessRecord,
+    ScoreRecord,
+    SpeedRecord,
+    WifiLinkRecord,
+)
 
 
 @pytest.fixture
@@ -21,55 +36,61 @@ def mock_client(mocker):
     client.get_web_responsiveness = AsyncMock(return_value=[])
     client.get_speed_results = AsyncMock(return_value=[])
     client.get_wifi_link = AsyncMock(return_value=[])
-    client.get_all_datasets = AsyncMock(return_value={})
+    client.get_all_datasets = AsyncMock(
+        return_value=AllDatasetsResponse(
+            scores_1m=[], web_responsiveness=[], speed_results=[]
+        )
+    )
     mocker.patch.object(mcp_server, "get_client", return_value=client)
+    mocker.patch.dict(mcp_server._circuits, clear=True)
     return client
 
 
-@pytest.fixture
-def ctx():
-    """Minimal Context stub with async info()."""
-    c = MagicMock()
-    c.info = AsyncMock()
-    return c
-
-
-async def test_get_scores_1m_tool(mock_client, ctx):
-    result = await mcp_server.get_scores_1m.fn(ctx, host="h")
+async def test_get_scores_1m_tool(mock_client):
+    result = await mcp_server.get_scores_1m.fn(host="h")
     assert result == []
     mock_client.get_scores_1m.assert_awaited_once()
-    ctx.info.assert_awaited_once()
 
 
-async def test_get_responsiveness_tool(mock_client, ctx):
-    result = await mcp_server.get_responsiveness.fn(ctx, host="h", granularity="1s")
+async def test_tools_log_at_debug(mock_client, caplog):
+    mock_client.host = "h"
+    with caplog.at_level("DEBUG", logger="orbnet.mcp_server"):
+        await mcp_server.get_speed_results.fn(host="h")
+    assert caplog.records[-1].levelname == "DEBUG"
+    assert caplog.records[-1].getMessage() == (
+        "Getting speed test data from Orb sensor h"
+    )
+
+
+async def test_get_responsiveness_tool(mock_client):
+    result = await mcp_server.get_responsiveness.fn(host="h", granularity="1s")
     assert result == []
     mock_client.get_responsiveness.assert_awaited_once_with(granularity="1s")
 
 
-async def test_get_web_responsiveness_tool(mock_client, ctx):
-    result = await mcp_server.get_web_responsiveness.fn(ctx, host="h")
+async def test_get_web_responsiveness_tool(mock_client):
+    result = await mcp_server.get_web_responsiveness.fn(host="h")
     assert result == []
     mock_client.get_web_responsiveness.assert_awaited_once()
 
 
-async def test_get_speed_results_tool(mock_client, ctx):
-    result = await mcp_server.get_speed_results.fn(ctx, host="h")
+async def test_get_speed_results_tool(mock_client):
+    result = await mcp_server.get_speed_results.fn(host="h")
     assert result == []
     mock_client.get_speed_results.assert_awaited_once()
 
 
-async def test_get_wifi_link_tool(mock_client, ctx):
-    result = await mcp_server.get_wifi_link.fn(ctx, host="h", granularity="15s")
+async def test_get_wifi_link_tool(mock_client):
+    result = await mcp_server.get_wifi_link.fn(host="h", granularity="15s")
     assert result == []
     mock_client.get_wifi_link.assert_awaited_once_with(granularity="15s")
 
 
-async def test_get_all_datasets_tool(mock_client, ctx):
+async def test_get_all_datasets_tool(mock_client):
     result = await mcp_server.get_all_datasets.fn(
-        ctx, host="h", include_all_responsiveness=True, include_all_wifi_link=True
+        host="h", include_all_responsiveness=True, include_all_wifi_link=True
     )
-    assert result == {}
+    assert result == mock_client.get_all_datasets.return_value
     mock_client.get_all_datasets.assert_awaited_once_with(
         include_all_responsiveness=True,
         include_all_wifi_link=True,
@@ -77,6 +98,222 @@ async def test_get_all_datasets_tool(mock_client, ctx):
     )
 
 
+def _score(timestamp, sample_scores_data):
+    return ScoreRecord(**{**sample_scores_data[0], "timestamp": timestamp})
+
+
+async def test_tools_skip_records_from_before_server_start(
+    mock_client, sample_scores_data
+):
+    start = mcp_server._SERVER_START_MS
+    old, new = _score(start - 1, sample_scores_data), _score(start, sample_scores_data)
+    mock_client.get_scores_1m.return_value = [old, new]
+
+    assert await mcp_server.get_scores_1m.fn(host="h") == [new]
+    assert await mcp_server.get_scores_1m.fn(host="h", since=0) == [old, new]
+
+
+async def test_persistent_caller_id_keeps_records_from_before_start(
+    mock_client, mocker, sample_scores_data
+):
+    # Set from ORB_CALLER_ID when the server module is imported
+    mocker.patch.object(mcp_server, "_DEFAULT_SINCE", 0)
+    start = mcp_server._SERVER_START_MS
+    old, new = _score(start - 1, sample_scores_data), _score(start, sample_scores_data)
+    mock_client.get_scores_1m.return_value = [old, new]
+
+    assert await mcp_server.get_scores_1m.fn(host="h") == [old, new]
+
+
+def test_persistent_caller_id_disables_default_since():
+    code = "from orbnet import mcp_server; print(mcp_server._DEFAULT_SINCE)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "ORB_CALLER_ID": "persistent-id"},
+    )
+    assert result.stdout.strip() == "0"
+    assert mcp_server._DEFAULT_SINCE == mcp_server._SERVER_START_MS
+
+
+async def test_tools_keep_newest_records_up_to_limit(mock_client, sample_scores_data):
+    records = [_score(t, sample_scores_data) for t in range(1, 5)]
+    mock_client.get_scores_1m.return_value = records
+
+    assert await mcp_server.get_scores_1m.fn(host="h", since=0, limit=2) == records[2:]
+    assert await mcp_server.get_scores_1m.fn(host="h", since=0, limit=0) == []
+    assert (
+        await mcp_server.get_scores_1m.fn(host="h", since=3, limit=None) == records[2:]
+    )
+
+
+async def test_get_all_datasets_trims_each_dataset(mock_client, sample_scores_data):
+    records = [_score(t, sample_scores_data) for t in range(1, 5)]
+    mock_client.get_all_datasets.return_value = AllDatasetsResponse(
+        scores_1m=records, web_responsiveness={"error": "boom"}, speed_results=[]
+    )
+
+    result = await mcp_server.get_all_datasets.fn(host="h", since=0, limit=1)
+    assert result.scores_1m == records[3:]
+    assert result.web_responsiveness == {"error": "boom"}
+    assert mock_client.get_all_datasets.return_value.scores_1m == records
+
+
+async def test_get_summary_tool(
+    mock_client,
+    mocker,
+    sample_scores_data,
+    sample_responsiveness_data,
+    sample_speed_data,
+    sample_wifi_link_data,
+):
+    get_client = mocker.patch.object(mcp_server, "get_client", return_value=mock_client)
+    responsiveness = [
+        ResponsivenessRecord(
+            **{**sample_responsiveness_data[0], "latency_avg_us": latency}
+        )
+        for latency in range(10_000, 110_000, 1_000)
+    ]
+    mock_client.get_all_datasets.return_value = AllDatasetsResponse(
+        scores_1m=[ScoreRecord(**record) for record in sample_scores_data],
+        responsiveness_1m=responsiveness,
+        web_responsiveness=[],
+        speed_results=[SpeedRecord(**record) for record in sample_speed_data],
+        wifi_link_1m={"error": "disabled"},
+    )
+
+    summary = await mcp_server.get_summary.fn(host="h", granularity="1m", since=0)
+
+    mock_client.get_all_datasets.assert_awaited_once_with(default_granularity="1m")
+    # The summary polls with its own caller ID
+    assert get_client.call_args.args[2] == f"{mcp_server.config.caller_id}-summary"
+    assert summary.orb_score_mean == pytest.approx(
+        sum(r["orb_score"] for r in sample_scores_data) / len(sample_scores_data)
+    )
+    assert summary.latency_us.p50 == pytest.approx(59_500)
+    assert summary.latency_us.p95 == pytest.approx(104_050)
+    assert summary.high_latency
+    assert summary.download_kbps_mean == sample_speed_data[0]["download_kbps"]
+    assert summary.rssi_avg_mean is None
+    assert not summary.wifi_weak
+    assert summary.unavailable == ["wifi_link_1m"]
+
+
+async def test_get_summary_flags_weak_wifi(mock_client, sample_wifi_link_data):
+    wifi_link = [
+        WifiLinkRecord(**{**sample_wifi_link_data[0], "rssi_avg": -80.0}),
+    ]
+    mock_client.get_all_datasets.return_value = AllDatasetsResponse(
+        scores_1m=[],
+        responsiveness_1s=[],
+        web_responsiveness=[],
+        speed_results=[],
+        wifi_link_1s=wifi_link,
+    )
+
+    summary = await mcp_server.get_summary.fn(host="h", caller_id="mine", since=0)
+
+    assert summary.wifi_weak
+    assert summary.rssi_avg_mean == -80.0
+    assert summary.orb_score_mean is None
+    assert summary.latency_us is None
+    assert not summary.high_latency
+    assert not summary.high_packet_loss
+    assert summary.unavailable == []
+
+
+async def test_concurrent_identical_calls_share_request(mock_client):
+    async def slow_scores():
+        await asyncio.sleep(0.01)
+        return ["record"]
+
+    mock_client.get_scores_1m.side_effect = slow_scores
+    first, second = await asyncio.gather(
+        mcp_server.get_scores_1m.fn(host="h", since=0, limit=None),
+        mcp_server.get_scores_1m.fn(host="h", since=0, limit=None),
+    )
+    assert first == second == ["record"]
+    mock_client.get_scores_1m.assert_awaited_once()
+    assert mcp_server._in_flight == {}
+
+    # A finished request is not reused; the sensor only returns new records
+    await mcp_server.get_scores_1m.fn(host="h", since=0, limit=None)
+    assert mock_client.get_scores_1m.await_count == 2
+
+
+async def test_circuit_opens_after_repeated_failures(mock_client, mocker):
+    mock_client.host, mock_client.port = "h", 7080
+    mock_client.get_scores_1m.side_effect = httpx.ConnectError("refused")
+
+    for _ in range(mcp_server._CIRCUIT_THRESHOLD):
+        with pytest.raises(httpx.ConnectError):
+            await mcp_server.get_scores_1m.fn(host="h")
+
+    # Open: every tool for this sensor fails fast without a request
+    with pytest.raises(ToolError, match="h:7080 is unreachable"):
+        await mcp_server.get_speed_results.fn(host="h")
+    mock_client.get_speed_results.assert_not_called()
+
+    # After the cooldown a call goes through, and success closes the circuit
+    later = mcp_server.time.monotonic() + mcp_server._CIRCUIT_COOLDOWN + 1
+    mocker.patch.object(mcp_server.time, "monotonic", return_value=later)
+    assert await mcp_server.get_speed_results.fn(host="h") == []
+    assert mcp_server._circuits == {}
+
+
+async def test_circuit_counts_all_datasets_failing(mock_client):
+    mock_client.host, mock_client.port = "h", 7080
+    error = {"error": "All connection attempts failed"}
+    mock_client.get_all_datasets.return_value = AllDatasetsResponse(
+        scores_1m=error, web_responsiveness=error, speed_results=error
+    )
+
+    for _ in range(mcp_server._CIRCUIT_THRESHOLD):
+        await mcp_server.get_all_datasets.fn(host="h")
+
+    with pytest.raises(ToolError, match="h:7080 is unreachable"):
+        await mcp_server.get_summary.fn(host="h")
+
+
+async def test_circuit_ignores_partial_all_datasets_failure(mock_client):
+    mock_client.host, mock_client.port = "h", 7080
+    mock_client.get_all_datasets.return_value = AllDatasetsResponse(
+        scores_1m=[], web_responsiveness={"error": "boom"}, speed_results=[]
+    )
+
+    for _ in range(mcp_server._CIRCUIT_THRESHOLD + 1):
+        await mcp_server.get_all_datasets.fn(host="h")
+    assert mcp_server._circuits == {}
+
+
+async def test_circuit_ignores_http_errors(mock_client):
+    mock_client.host, mock_client.port = "h", 7080
+    mock_client.get_scores_1m.side_effect = httpx.HTTPStatusError(
+        "404", request=MagicMock(), response=MagicMock()
+    )
+    for _ in range(mcp_server._CIRCUIT_THRESHOLD + 1):
+        with pytest.raises(httpx.HTTPStatusError):
+            await mcp_server.get_scores_1m.fn(host="h")
+
+
+async def test_single_flight_survives_cancelled_caller():
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.create_task(mcp_server._single_flight(("k",), fetch))
+    await started.wait()
+    second = asyncio.create_task(mcp_server._single_flight(("k",), fetch))
+    first.cancel()
+
+    assert await second == "done"
+
+
 def test_get_client_info_tool(mock_client):
     mock_client.host = "h"
     mock_client.port = 7080
@@ -89,6 +326,82 @@ def test_get_client_info_tool(mock_client):
     assert info["caller_id"] == "cid"
 
 
+def test_get_client_is_cached(mocker):
+    mocker.patch.dict(mcp_server._clients, clear=True)
+    client = mcp_server.get_client("h")
+    assert isinstance(client, OrbAPIClient)
+    assert mcp_server.get_client("h") is client
+    assert mcp_server.get_client("h", port=mcp_server.config.port) is client
+    assert mcp_server.get_client("h", caller_id="other") is not client
+    assert client.caller_id == mcp_server.config.caller_id
+
+
+async def test_client_cache_evicts_least_recently_used(mocker):
+    mocker.patch.dict(mcp_server._clients, clear=True)
+    aclose = mocker.patch.object(OrbAPIClient, "aclose", AsyncMock())
+    first, second = mcp_server.get_client("h", caller_id="0"), None
+    for i in range(1, mcp_server._MAX_CLIENTS):
+        client = mcp_server.get_client("h", caller_id=str(i))
+        second = second or client
+    assert mcp_server.get_client("h", caller_id="0") is first
+
+    # The cache is full, so the least recently used client is closed
+    mcp_server.get_client("h", caller_id="new")
+    assert len(mcp_server._clients) == mcp_server._MAX_CLIENTS
+    assert second not in mcp_server._clients.values()
+    assert mcp_server.get_client("h", caller_id="0") is first
+
+    # Shutdown closes the cached clients and waits for the evicted one
+    await mcp_server.close_clients()
+    assert aclose.await_count == mcp_server._MAX_CLIENTS + 1
+    assert mcp_server._closing == set()
+
+
+def test_client_cache_evicts_without_event_loop(mocker):
+    mocker.patch.dict(mcp_server._clients, clear=True)
+    close = mocker.patch.object(OrbAPIClient, "close")
+    for i in range(mcp_server._MAX_CLIENTS + 1):
+        mcp_server.get_client("h", caller_id=str(i))
+    close.assert_called_once()
+    assert len(mcp_server._clients) == mcp_server._MAX_CLIENTS
+
+
+async def test_lifespan_closes_clients(mocker):
+    mocker.patch.dict(mcp_server._clients, clear=True)
+    client = mcp_server.get_client("h")
+    aclose = mocker.patch.object(OrbAPIClient, "aclose", AsyncMock())
+
+    async with mcp_server._lifespan(mcp_server.mcp):
+        pass
+
+    aclose.assert_awaited_once()
+    assert mcp_server._clients == {}
+    assert mcp_server.get_client("h") is not client
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("ORB_HOST", "10.0.0.2")
+    monkeypatch.setenv("ORB_PORT", "8080")
+    monkeypatch.setenv("ORB_CALLER_ID", "persistent-id")
+    mcp_server.OrbSensorConfig.from_env.cache_clear()
+    try:
+        config = mcp_server.OrbSensorConfig.from_env()
+        assert (config.host, config.port, config.timeout) == ("10.0.0.2", 8080, 30.0)
+        assert config.caller_id == "persistent-id"
+        assert mcp_server.OrbSensorConfig.from_env() is config
+
+        monkeypatch.delenv("ORB_CALLER_ID")
+        mcp_server.OrbSensorConfig.from_env.cache_clear()
+        assert len(mcp_server.OrbSensorConfig.from_env().caller_id) == 24
+    finally:
+        mcp_server.OrbSensorConfig.from_env.cache_clear()
+
+
+def test_config_is_frozen():
+    with pytest.raises(ValidationError):
+        mcp_server.config.caller_id = "other"
+
+
 def test_analyze_network_quality_prompt():
     text = mcp_server.analyze_network_quality.fn()
     assert "get_scores_1m" in text
@@ -104,7 +417,36 @@ def test_troubleshoot_wifi_prompt():
     assert "get_wifi_link" in text
 
 
+@pytest.mark.parametrize(
+    "prompt",
+    [
+        mcp_server.analyze_network_quality,
+        mcp_server.troubleshoot_slow_internet,
+        mcp_server.troubleshoot_wifi,
+    ],
+)
+def test_prompts_are_dedented(prompt):
+    text = prompt.fn()
+    assert text is prompt.fn()
+    assert not text[0].isspace()
+    assert "\n1. " in text
+
+
+def test_instructions_are_dedented():
+    assert mcp_server.mcp.instructions.startswith("This server provides")
+
+
 def test_main_invokes_mcp_run(mocker):
+    mocker.patch("importlib.util.find_spec", return_value=None)
     run = mocker.patch.object(mcp_server.mcp, "run")
     mcp_server.main()
     run.assert_called_once()
+
+
+def test_main_uses_uvloop_when_available(mocker):
+    mocker.patch("importlib.util.find_spec", return_value=object())
+    run = mocker.patch.object(mcp_server.anyio, "run")
+    mcp_server.main()
+    run.assert_called_once_with(
+        mcp_server.mcp.run_async, backend_options={"use_uvloop": True}
+    )
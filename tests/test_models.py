@@ -38,6 +38,7 @@ class TestOrbClientConfig:
         assert config.caller_id is None
         assert config.client_id is None
         assert config.timeout == 30.0
+        assert config.max_retries == 3
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -77,6 +78,13 @@ class TestOrbClientConfig:
         with pytest.raises(ValidationError):
             OrbClientConfig(host="192.168.1.100", timeout=-1.0)
 
+    def test_max_retries_validation(self):
+        """Test max_retries validation."""
+        OrbClientConfig(host="192.168.1.100", max_retries=0)
+
+        with pytest.raises(ValidationError):
+            OrbClientConfig(host="192.168.1.100", max_retries=-1)
+
 
 class TestDatasetRequestParams:
     """Test DatasetRequestParams model."""
@@ -0,0 +1,78 @@
+"""
+Tests for the top-level orbnet package exports.
+"""
+
+import importlib.util
+import subprocess
+import sys
+from importlib.metadata import version
+
+import pytest
+
+import orbnet
+from orbnet import client, models
+
+
+class TestPackageExports:
+    """Test lazily-loaded package exports."""
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing orbnet does not import client or models."""
+        code = (
+            "import sys, orbnet; "
+            "print('orbnet.client' in sys.modules, 'orbnet.models' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False False"
+
+    def test_import_defers_record_validators(self):
+        """Test that importing the client doesn't build record validators."""
+        code = (
+            "from orbnet.client import OrbAPIClient; "
+            "from orbnet.models import ScoreRecord; "
+            "print(ScoreRecord.__pydantic_complete__)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.parametrize("name", orbnet.__all__)
+    def test_all_names_resolve(self, name):
+        """Test that every name in __all__ resolves to the submodule object."""
+        source = client if name == "OrbAPIClient" else models
+        assert getattr(orbnet, name) is getattr(source, name)
+
+    def test_star_import(self):
+        """Test that `from orbnet import *` exports every name in __all__."""
+        namespace: dict = {}
+        exec("from orbnet import *", namespace)
+        assert set(orbnet.__all__) <= set(namespace)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            orbnet.no_such_name  # noqa: B018
+
+    def test_single_package_location(self):
+        """Test that exactly one copy of the orbnet package is importable."""
+        spec = importlib.util.find_spec("orbnet")
+        assert spec is not None
+        assert len(spec.submodule_search_locations or []) == 1
+
+    def test_all_matches_lazy_imports(self):
+        """Test that __all__ and the lazy import table list the same names."""
+        assert set(orbnet.__all__) == set(orbnet._LAZY_IMPORTS)
+        assert "WifiLinkRecord" in orbnet.__all__
+
+    def test_version(self):
+        """Test that __version__ matches the installed distribution metadata."""
+        assert orbnet.__version__ == version("orbnet")
+        assert vars(orbnet)["__version__"] == orbnet.__version__
+
+    def test_dir_lists_exports(self):
+        """Test that dir() includes the lazily-loaded exports."""
+        assert set(orbnet.__all__) <= set(dir(orbnet))
+        assert "__version__" in dir(orbnet)